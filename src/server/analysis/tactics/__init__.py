@@ -1,5 +1,7 @@
 """Tactical motif detection: pins, forks, skewers, hanging pieces, and more."""
 
+from dataclasses import replace
+
 import chess
 
 from server.analysis.tactics.types import (
@@ -74,16 +76,22 @@ __all__ = [
 ]
 
 
+def _valued(items: list, value_fn, board: chess.Board) -> list:
+    """Copies of *items* with their TacticValue filled in by *value_fn*."""
+    return [replace(item, value=value_fn(item, board)) for item in items]
+
+
 def analyze_tactics(board: chess.Board) -> TacticalMotifs:
     ray = _find_ray_motifs(board)
     mate_threats = _find_mate_threats(board)
     back_rank_weaknesses = _find_back_rank_weaknesses(board)
+    # Valuation pass: each valued motif gets its TacticValue on construction
     motifs = TacticalMotifs(
-        pins=ray.pins,
-        forks=_find_forks(board, pins=ray.pins),
-        skewers=ray.skewers,
-        hanging=_find_hanging(board),
-        discovered_attacks=ray.discovered_attacks,
+        pins=_valued(ray.pins, _value_pin, board),
+        forks=_valued(_find_forks(board, pins=ray.pins), _value_fork, board),
+        skewers=_valued(ray.skewers, _value_skewer, board),
+        hanging=_valued(_find_hanging(board), _value_hanging, board),
+        discovered_attacks=_valued(ray.discovered_attacks, _value_discovered, board),
         double_checks=_find_double_checks(board),
         trapped_pieces=_find_trapped_pieces(board),
         mate_patterns=_find_mate_patterns(board),
@@ -92,30 +100,20 @@ def analyze_tactics(board: chess.Board) -> TacticalMotifs:
         xray_attacks=ray.xray_attacks,
         xray_defenses=ray.xray_defenses,
         exposed_kings=_find_exposed_kings(board),
-        overloaded_pieces=_find_overloaded_pieces(
+        overloaded_pieces=_valued(
+            _find_overloaded_pieces(
+                board,
+                back_rank_weaknesses=back_rank_weaknesses,
+                mate_threats=mate_threats,
+            ),
+            _value_overloaded,
             board,
-            back_rank_weaknesses=back_rank_weaknesses,
-            mate_threats=mate_threats,
         ),
-        capturable_defenders=_find_capturable_defenders(board),
+        capturable_defenders=_valued(
+            _find_capturable_defenders(board), _value_capturable_defender, board,
+        ),
     )
 
-    # Valuation pass: compute TacticValue for each motif
-    for h in motifs.hanging:
-        h.value = _value_hanging(h, board)
-    for p in motifs.pins:
-        p.value = _value_pin(p, board)
-    for f in motifs.forks:
-        f.value = _value_fork(f, board)
-    for s in motifs.skewers:
-        s.value = _value_skewer(s, board)
-    for da in motifs.discovered_attacks:
-        da.value = _value_discovered(da, board)
-    for cd in motifs.capturable_defenders:
-        cd.value = _value_capturable_defender(cd, board)
-    for op in motifs.overloaded_pieces:
-        op.value = _value_overloaded(op, board)
-
     # Cross-reference: link hanging pieces to pins via defense_notes
     for h in motifs.hanging:
         if h.value and h.value.defense_notes:
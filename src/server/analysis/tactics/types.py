@@ -1,4 +1,8 @@
-"""Tactical motif types: dataclasses, containers, and shared constants."""
+"""Tactical motif types: dataclasses, containers, and shared constants.
+
+Motifs and TacticalMotifs are frozen, slotted dataclasses: detectors build
+them once and later passes derive new instances with dataclasses.replace().
+"""
 
 from dataclasses import dataclass, field
 
@@ -17,7 +21,7 @@ class TacticValue:
     related_motifs: list[str] = field(default_factory=list)  # cross-refs: ["pin:b5-c6-e8"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Pin:
     pinned_square: str
     pinned_piece: str
@@ -30,7 +34,7 @@ class Pin:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Fork:
     forking_square: str
     forking_piece: str
@@ -43,7 +47,7 @@ class Fork:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Skewer:
     attacker_square: str
     attacker_piece: str
@@ -56,7 +60,7 @@ class Skewer:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HangingPiece:
     square: str
     piece: str
@@ -66,7 +70,7 @@ class HangingPiece:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiscoveredAttack:
     blocker_square: str
     blocker_piece: str
@@ -79,25 +83,25 @@ class DiscoveredAttack:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DoubleCheck:
     checker_squares: list[str]
     color: str = ""  # "white" or "black" — color of the checking side
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrappedPiece:
     square: str
     piece: str
     color: str = ""  # "white" or "black" — color of the trapped piece
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatePattern:
     pattern: str  # e.g. "back_rank", "smothered", "arabian", "hook", etc.
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MateThreat:
     threatening_color: str  # "white" or "black"
     mating_square: str      # square where mate would be delivered
@@ -105,13 +109,13 @@ class MateThreat:
     mating_move: str | None = None  # SAN of the key mating move (if known)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BackRankWeakness:
     weak_color: str  # "white" or "black" — whose back rank is vulnerable
     king_square: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class XRayAttack:
     slider_square: str
     slider_piece: str
@@ -122,7 +126,7 @@ class XRayAttack:
     color: str = ""  # "white" or "black" — color of the slider
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class XRayDefense:
     slider_square: str
     slider_piece: str
@@ -133,13 +137,13 @@ class XRayDefense:
     color: str = ""  # "white" or "black" — color of the slider
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExposedKing:
     color: str  # "white" or "black" — whose king is exposed
     king_square: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OverloadedPiece:
     square: str
     piece: str
@@ -148,7 +152,7 @@ class OverloadedPiece:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CapturableDefender:
     defender_square: str
     defender_piece: str
@@ -159,7 +163,7 @@ class CapturableDefender:
     value: TacticValue | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TacticalMotifs:
     pins: list[Pin] = field(default_factory=list)
     forks: list[Fork] = field(default_factory=list)
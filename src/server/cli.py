@@ -86,7 +86,10 @@ async def _run(args: argparse.Namespace) -> dict:
             base_url=args.ollama_url,
             model=args.model,
         )
-        advice = await teacher.explain_move(prompt)
+        try:
+            advice = await teacher.explain_move(prompt)
+        finally:
+            await teacher.aclose()
 
     updated_fen = board.fen()
     return {
@@ -7,14 +7,20 @@ with a clear error if they are not set.
 We read from .env.chess instead of .env because ChromaDB's Settings
 class (also a BaseSettings subclass with extra="forbid") auto-reads
 .env and rejects any keys it doesn't recognize.
+
+Settings are frozen: they are read once at startup and never mutated,
+so a single instance can be shared freely. Use get_settings() to get the
+process-wide instance; the environment is read on its first call only.
 """
 
+import functools
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=".env.chess", env_file_encoding="utf-8",
+        env_file=".env.chess", env_file_encoding="utf-8", frozen=True,
     )
 
     # LLM (OpenAI-compatible — works with Ollama, OpenRouter, litellm, etc.)
@@ -31,6 +37,7 @@ class Settings(BaseSettings):
     # Stockfish
     stockfish_path: str = "stockfish"
     stockfish_hash_mb: int = 64
+    stockfish_threads: int = 1
     stockfish_mode: str = "local"  # "local" (subprocess) or "browser" (WebSocket)
 
     # Data paths
@@ -52,3 +59,12 @@ class Settings(BaseSettings):
     def effective_embed_api_key(self) -> str | None:
         """Embedding API key, falling back to llm_api_key."""
         return self.embed_api_key or self.llm_api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings, read from the environment on first call.
+
+    Tests that change the environment call get_settings.cache_clear().
+    """
+    return Settings()
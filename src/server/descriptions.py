@@ -12,7 +12,9 @@ Tactic diffing finds new/resolved motifs between parent and child.
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
+import itertools
 
 import chess
 
@@ -34,56 +36,59 @@ from server.motifs import (
 # Tense conversion — present to past
 # ---------------------------------------------------------------------------
 
-# Ordered list of (pattern, replacement). Applied in order; first match wins
-# for each region of text. Patterns use word boundaries to avoid partial matches.
-_PRESENT_TO_PAST: list[tuple[re.Pattern, str]] = [
+# Ordered (present, past) phrase pairs. They are fused into one alternation
+# so each text is scanned once; where phrases overlap, the earlier (longer)
+# one wins. Word boundaries avoid partial matches.
+_PRESENT_TO_PAST: tuple[tuple[str, str], ...] = (
     # --- Be-verbs (most common in motif output) ---
-    (re.compile(r"\bare connected\b"), "were connected"),
-    (re.compile(r"\bis left hanging\b"), "was left hanging"),
-    (re.compile(r"\bis actively placed\b"), "was actively placed"),
-    (re.compile(r"\bis in check\b"), "was in check"),
-    (re.compile(r"\bis up approximately\b"), "was up approximately"),
-    (re.compile(r"\bis undefended\b"), "was undefended"),
-    (re.compile(r"\bis hanging\b"), "was hanging"),
-    (re.compile(r"\bis trapped\b"), "was trapped"),
-    (re.compile(r"\bis weak\b"), "was weak"),
-    (re.compile(r"\bis exposed\b"), "was exposed"),
-    (re.compile(r"\bis overloaded\b"), "was overloaded"),
+    ("are connected", "were connected"),
+    ("is left hanging", "was left hanging"),
+    ("is actively placed", "was actively placed"),
+    ("is in check", "was in check"),
+    ("is up approximately", "was up approximately"),
+    ("is undefended", "was undefended"),
+    ("is hanging", "was hanging"),
+    ("is trapped", "was trapped"),
+    ("is weak", "was weak"),
+    ("is exposed", "was exposed"),
+    ("is overloaded", "was overloaded"),
 
     # --- Action verbs (motif renderers) ---
-    (re.compile(r"\bpins and also attacks\b"), "pinned and also attacked"),
-    (re.compile(r"\bforks\b"), "forked"),
-    (re.compile(r"\bpins\b"), "pinned"),
-    (re.compile(r"\bskewers\b"), "skewered"),
-    (re.compile(r"\bx-rays\b"), "x-rayed"),
-    (re.compile(r"\breveals\b"), "revealed"),
-    (re.compile(r"\bthreaten\b"), "threatened"),
-    (re.compile(r"\bdefends\b"), "defended"),
-    (re.compile(r"\bcontrols\b"), "controlled"),
-    (re.compile(r"\boccupies\b"), "occupied"),
+    ("pins and also attacks", "pinned and also attacked"),
+    ("forks", "forked"),
+    ("pins", "pinned"),
+    ("skewers", "skewered"),
+    ("x-rays", "x-rayed"),
+    ("reveals", "revealed"),
+    ("threaten", "threatened"),
+    ("defends", "defended"),
+    ("controls", "controlled"),
+    ("occupies", "occupied"),
 
     # --- Positional observations ---
-    (re.compile(r"\bhas not fully developed\b"), "had not fully developed"),
-    (re.compile(r"\bhas a weak\b"), "had a weak"),
-    (re.compile(r"\bhas isolated\b"), "had isolated"),
-    (re.compile(r"\bhas passed\b"), "had passed"),
-    (re.compile(r"\bhas open files\b"), "had open files"),
-]
+    ("has not fully developed", "had not fully developed"),
+    ("has a weak", "had a weak"),
+    ("has isolated", "had isolated"),
+    ("has passed", "had passed"),
+    ("has open files", "had open files"),
+)
+
+_PAST_TENSE: dict[str, str] = dict(_PRESENT_TO_PAST)
+_PRESENT_TENSE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(present) for present, _ in _PRESENT_TO_PAST) + r")\b"
+)
 
 
 def _to_past_tense(text: str) -> str:
     """Convert known present-tense verb forms to past tense.
 
-    Uses an ordered list of regex substitutions. Each pattern matches at most
-    once per sentence (re.sub replaces all occurrences, but our patterns are
-    specific enough that double-matching is not a concern).
+    A single regex pass over _PRESENT_TO_PAST; each matched phrase is
+    swapped for its past-tense form.
 
     Unrecognized verb forms pass through unchanged — this is intentional.
-    New motif renderers should add their verb pattern here.
+    New motif renderers should add their verb phrase here.
     """
-    for pattern, replacement in _PRESENT_TO_PAST:
-        text = pattern.sub(replacement, text)
-    return text
+    return _PRESENT_TENSE_RE.sub(lambda m: _PAST_TENSE[m.group()], text)
 
 
 # ---------------------------------------------------------------------------
@@ -150,16 +155,16 @@ def diff_tactics(parent_tactics: TacticalMotifs, child_tactics: TacticalMotifs)
     )
 
 
-def _new_motif_types(diff: TacticDiff) -> set[str]:
-    """Extract motif type labels from the new tactic keys in a diff."""
-    return {key[0] for key in diff.new_keys}
+def _new_motif_types(new_keys: AbstractSet[tuple]) -> set[str]:
+    """Extract motif type labels from a set of new tactic keys."""
+    return {key[0] for key in new_keys}
 
 
 # ---------------------------------------------------------------------------
 # Position description
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PositionDescription:
     """Structured position description with three buckets."""
     threats: list[str] = field(default_factory=list)
@@ -168,10 +173,10 @@ class PositionDescription:
 
     def as_text(self, max_items: int = 8) -> str:
         """Flatten to a single text string (for LLM context)."""
-        parts = self.threats + self.opportunities + self.observations
-        if not parts:
+        if not (self.threats or self.opportunities or self.observations):
             return "The position is roughly balanced with no major imbalances."
-        return " ".join(parts[:max_items])
+        parts = itertools.chain(self.threats, self.opportunities, self.observations)
+        return " ".join(itertools.islice(parts, max_items))
 
 
 def _should_skip_back_rank(report: PositionReport) -> bool:
@@ -349,24 +354,34 @@ def describe_position(
 # False discovered attack filter
 # ---------------------------------------------------------------------------
 
+def _discovered_blockers(tactics: TacticalMotifs) -> dict[tuple[str, str], str]:
+    """Map (slider_square, target_square) -> blocker_square for discovered attacks."""
+    return {
+        (da.slider_square, da.target_square): da.blocker_square
+        for da in tactics.discovered_attacks
+    }
+
+
 def _blocker_is_move_dest(
     key: tuple,
     tactics: TacticalMotifs,
     move_dest: str,
+    blockers: dict[tuple[str, str], str] | None = None,
 ) -> bool:
     """Check if a discovered-attack key's blocker square is the move destination.
 
     When a piece moves ONTO a slider ray, the after-position detects a
     DiscoveredAttack with the arriving piece as "blocker". But nothing was
     "discovered" — the piece arrived there, it didn't move away. Filter these.
+
+    Callers checking many keys against one position pass *blockers* (from
+    _discovered_blockers) so the lookup is a dict hit instead of a scan.
     """
     if key[0] != "discovered":
         return False
-    slider_sq, target_sq = key[1], key[2]
-    for da in tactics.discovered_attacks:
-        if da.slider_square == slider_sq and da.target_square == target_sq and da.blocker_square == move_dest:
-            return True
-    return False
+    if blockers is None:
+        blockers = _discovered_blockers(tactics)
+    return blockers.get((key[1], key[2])) == move_dest
 
 
 # ---------------------------------------------------------------------------
@@ -401,28 +416,32 @@ def describe_changes(
     # Walk the continuation chain (node itself + up to max_plies-1 children)
     chain = _get_continuation_chain(node, max_depth=max_plies - 1)
 
-    prev_tactics = node.parent.tactics
+    # Key sets are cached on each node, so each position is keyed once
+    prev_keys = node.parent.tactic_keys
     # Track motifs already seen in parent to prevent repetition across plies
-    seen_motif_keys: set[tuple] = all_tactic_keys(prev_tactics)
+    seen_motif_keys: set[tuple] = set(prev_keys)
 
     for i, chain_node in enumerate(chain):
         current_tactics = chain_node.tactics
-        diff = diff_tactics(prev_tactics, current_tactics)
-        new_types = _new_motif_types(diff)
+        current_keys = chain_node.tactic_keys
+        # Only the new keys matter here; resolved/persistent are never read
+        new_keys = current_keys - prev_keys
+        new_types = _new_motif_types(new_keys)
 
         # Filter new_keys to exclude motifs we've already rendered (from parent)
         # This prevents "pin of f7 to g8" from appearing in multiple plies
         # when the parent position already has that pin
-        filtered_new_keys = diff.new_keys - seen_motif_keys
+        filtered_new_keys = new_keys - seen_motif_keys
 
         # Filter out false discovered attacks: when a piece moves ONTO a
         # ray, the after-position has a DiscoveredAttack with the arriving
         # piece as "blocker", but nothing was actually "discovered".
-        if chain_node.move is not None:
+        if chain_node.move is not None and current_tactics.discovered_attacks:
             move_dest = chess.square_name(chain_node.move.to_square)
+            blockers = _discovered_blockers(current_tactics)
             filtered_new_keys = {
                 k for k in filtered_new_keys
-                if not _blocker_is_move_dest(k, current_tactics, move_dest)
+                if not _blocker_is_move_dest(k, current_tactics, move_dest, blockers)
             }
 
         # Render motifs via registry
@@ -444,10 +463,15 @@ def describe_changes(
             move_origin=origin_sq,
             move_piece=moved_piece,
         )
-        opps_rm, thrs_rm, obs_rm, rendered_keys = render_motifs(
-            current_tactics, new_types, ctx, new_keys=filtered_new_keys,
-            suppress_unsound_opps=(not is_played_move),
-        )
+        if filtered_new_keys:
+            opps_rm, thrs_rm, obs_rm, rendered_keys = render_motifs(
+                current_tactics, new_types, ctx, new_keys=filtered_new_keys,
+                suppress_unsound_opps=(not is_played_move),
+            )
+        else:
+            # Nothing new survives the filters, so render_motifs would emit
+            # nothing — skip its chain detection and ray dedup.
+            opps_rm, thrs_rm, obs_rm, rendered_keys = [], [], [], set()
 
         # Extract text lists for this ply
         opp_texts = [r.text for r in opps_rm]
@@ -493,7 +517,7 @@ def describe_changes(
                     seen_observations.add(r.text)
                     all_observations.append(r.text)
 
-        prev_tactics = current_tactics
+        prev_keys = current_keys
         # Update seen motifs for next iteration (prevent same motif across multiple plies)
         # Bug 2 fix: only track motifs that were actually rendered, not all
         # motifs in the position. This ensures re-emerging motifs (ones that
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 import asyncio
 import logging
@@ -8,6 +9,30 @@ import chess.engine
 
 logger = logging.getLogger(__name__)
 
+# Positions whose best_moves()/analyze_lines() result is kept per engine.
+# Opening positions recur across every game, so many searches are repeats.
+_RESULT_CACHE_SIZE = 4096
+
+
+def _cache_get(cache: OrderedDict, key: tuple) -> list | None:
+    """Return a cached result as a new list, marking it most recently used.
+
+    The entries themselves are frozen and shared between callers; only the
+    list is the caller's own.
+    """
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    cache.move_to_end(key)
+    return list(cached)
+
+
+def _cache_put(cache: OrderedDict, key: tuple, value: list) -> None:
+    """Store a result as a tuple, evicting the least recently used past the cap."""
+    cache[key] = tuple(value)
+    if len(cache) > _RESULT_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 @dataclass
 class Evaluation:
@@ -18,14 +43,14 @@ class Evaluation:
     pv: list[str]
 
 
-@dataclass
+@dataclass(frozen=True)
 class MoveInfo:
     uci: str
     score_cp: int | None
     score_mate: int | None
 
 
-@dataclass
+@dataclass(frozen=True)
 class LineInfo:
     """A single PV line with full continuation."""
     uci: str                    # first move UCI
@@ -53,11 +78,16 @@ class EngineProtocol(ABC):
 
 
 class EngineAnalysis(EngineProtocol):
-    def __init__(self, stockfish_path: str = "stockfish", hash_mb: int = 64):
+    def __init__(
+        self, stockfish_path: str = "stockfish", hash_mb: int = 64, threads: int = 1,
+    ):
         self._path = stockfish_path
         self._hash_mb = hash_mb
+        self._threads = threads
         self._engine: chess.engine.UciProtocol | None = None
         self._lock = asyncio.Lock()
+        self._best_moves_cache: OrderedDict[tuple[str, int, int], tuple[MoveInfo, ...]] = OrderedDict()
+        self._lines_cache: OrderedDict[tuple[str, int, int], tuple[LineInfo, ...]] = OrderedDict()
 
     async def start(self):
         if self._engine is not None:
@@ -67,7 +97,7 @@ class EngineAnalysis(EngineProtocol):
                 pass
             self._engine = None
         _, self._engine = await chess.engine.popen_uci(self._path)
-        await self._engine.configure({"Hash": self._hash_mb})
+        await self._engine.configure({"Hash": self._hash_mb, "Threads": self._threads})
 
     async def stop(self):
         if self._engine:
@@ -124,6 +154,10 @@ class EngineAnalysis(EngineProtocol):
         """MultiPV analysis returning full PV lines for each candidate."""
         if self._engine is None:
             raise RuntimeError("Engine not started. Call start() first.")
+        key = (fen, n, depth)
+        cached = _cache_get(self._lines_cache, key)
+        if cached is not None:
+            return cached
         board = self._validate_board(fen)
         async with self._lock:
             results = await self._analyse_with_retry(
@@ -144,11 +178,16 @@ class EngineAnalysis(EngineProtocol):
                     pv=[m.uci() for m in pv],
                     depth=info.get("depth", depth),
                 ))
-        return lines
+        _cache_put(self._lines_cache, key, lines)
+        return list(lines)
 
     async def best_moves(self, fen: str, n: int = 3, depth: int = 20) -> list[MoveInfo]:
         if self._engine is None:
             raise RuntimeError("Engine not started. Call start() first.")
+        key = (fen, n, depth)
+        cached = _cache_get(self._best_moves_cache, key)
+        if cached is not None:
+            return cached
         board = self._validate_board(fen)
         async with self._lock:
             results = await self._analyse_with_retry(
@@ -166,7 +205,8 @@ class EngineAnalysis(EngineProtocol):
                     score_cp=score.score(),
                     score_mate=score.mate(),
                 ))
-        return moves
+        _cache_put(self._best_moves_cache, key, moves)
+        return list(moves)
 
     async def find_mate_threats(
         self, fen: str, max_depth: int = 3, eval_depth: int = 10,
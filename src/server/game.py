@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 import chess
@@ -52,12 +53,15 @@ class GameManager:
         teacher: ChessTeacher | None = None,
         rag: ChessRAG | None = None,
         rag_top_k: int = 3,
+        max_sessions: int = 10_000,
     ):
         self._engine = engine
         self._teacher = teacher
         self._rag = rag
         self._rag_top_k = rag_top_k
-        self._sessions: dict[str, GameState] = {}
+        # Least recently used first; the oldest games are dropped past the cap
+        self._sessions: OrderedDict[str, GameState] = OrderedDict()
+        self._max_sessions = max_sessions
 
     def new_game(
         self, depth: int = 10, elo_profile: str = "intermediate", coach_name: str = "Anna Cramling"
@@ -70,10 +74,15 @@ class GameManager:
         self._sessions[session_id] = GameState(
             depth=depth, elo_profile=elo_profile, coach_name=coach_name
         )
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
         return session_id, chess.STARTING_FEN, "playing"
 
     def get_game(self, session_id: str) -> GameState | None:
-        return self._sessions.get(session_id)
+        state = self._sessions.get(session_id)
+        if state is not None:
+            self._sessions.move_to_end(session_id)
+        return state
 
     async def _enrich_coaching(
         self,
@@ -96,7 +105,7 @@ class GameManager:
         # RAG enrichment
         rag_context = ""
         if self._rag is not None:
-            report = analyze(board.copy())
+            report = analyze(board.copy(stack=False))
             rag_context = await query_knowledge(
                 self._rag, report,
                 coaching_data.quality.value,
@@ -144,7 +153,7 @@ class GameManager:
         self, session_id: str, move_uci: str, verbosity: str = "normal",
     ) -> dict:
         """Apply player move, get Stockfish response, return result dict."""
-        state = self._sessions.get(session_id)
+        state = self.get_game(session_id)
         if state is None:
             raise KeyError(f"Session not found: {session_id}")
 
@@ -27,11 +27,12 @@ from server.motifs import (
     HIGH_VALUE_KEYS,
     MODERATE_VALUE_KEYS,
     MOTIF_REGISTRY,
+    all_tactic_keys,
     motif_labels as _motif_labels,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TeachabilityWeights:
     """Configuration for pedagogical interest scoring."""
     motif_base: dict[str, float] = dc_field(default_factory=dict)
@@ -64,7 +65,7 @@ DEFAULT_WEIGHTS = TeachabilityWeights(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class GameNode:
     """A single position in the game tree.
 
@@ -82,6 +83,9 @@ class GameNode:
     # Lazy analysis — computed on first access, cached
     _tactics: TacticalMotifs | None = field(default=None, repr=False)
     _report: PositionReport | None = field(default=None, repr=False)
+    _tactic_keys: frozenset[tuple] | None = field(default=None, repr=False)
+    # Set by _rank_nodes_by_teachability
+    _interest_score: float = field(default=0.0, repr=False)
 
     @property
     def tactics(self) -> TacticalMotifs:
@@ -90,6 +94,16 @@ class GameNode:
             self._tactics = analyze_tactics(self.board)
         return self._tactics
 
+    @property
+    def tactic_keys(self) -> frozenset[tuple]:
+        """Identity keys of this position's tactics, computed lazily.
+
+        Anything that replaces _tactics must reset this cache to None.
+        """
+        if self._tactic_keys is None:
+            self._tactic_keys = frozenset(all_tactic_keys(self.tactics))
+        return self._tactic_keys
+
     @property
     def report(self) -> PositionReport:
         """Full position report, computed lazily."""
@@ -123,7 +137,9 @@ class GameNode:
         Sorting: mate scores first (positive mate > negative mate),
         then by score_cp descending. Nodes with no score go last.
         """
-        child_board = self.board.copy()
+        # Node boards never consult their move history, so skip copying it:
+        # replaying a long game stays linear instead of quadratic.
+        child_board = self.board.copy(stack=False)
         child_board.push(move)
         child = GameNode(
             board=child_board,
@@ -134,9 +150,7 @@ class GameNode:
             score_mate=score_mate,
         )
         # Insert in sorted position (best eval first)
-        keys = [_sort_key(c) for c in self.children]
-        idx = bisect.bisect_right(keys, _sort_key(child))
-        self.children.insert(idx, child)
+        bisect.insort_right(self.children, child, key=_sort_key)
         return child
 
 
@@ -161,7 +175,7 @@ def _sort_key(node: GameNode) -> tuple[int, int]:
     return (3, 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class OpponentResponse:
     """A candidate response move by the opponent after the student's move."""
     san: str
@@ -287,7 +301,8 @@ _PIECE_VALUES = {
 def _describe_opponent_move(board: chess.Board, move: chess.Move, student_is_white: bool) -> str:
     """Generate a short natural-language description of an opponent's move.
 
-    board is the position BEFORE the move is played.
+    board is the position BEFORE the move is played; it is briefly pushed
+    and popped, and is unchanged on return.
     Includes one notable insight about what the move accomplishes beyond
     the basic action (e.g., what it targets or defends).
     """
@@ -326,13 +341,16 @@ def _describe_opponent_move(board: chess.Board, move: chess.Move, student_is_whi
             desc = f"moves {piece_name} to {dest}"
 
     # Check for check
-    board_copy = board.copy()
-    board_copy.push(move)
-    if board_copy.is_check():
+    if board.gives_check(move):
         desc += " with check"
     elif not board.is_capture(move):
         # Add insight for non-captures (captures are self-describing)
-        insight = _move_insight(board_copy, move, student_is_white)
+        # Peek at the post-move position on the caller's board; pop restores it
+        board.push(move)
+        try:
+            insight = _move_insight(board, move, student_is_white)
+        finally:
+            board.pop()
         if insight:
             desc += f", {insight}"
 
@@ -351,16 +369,14 @@ def _move_insight(after_board: chess.Board, move: chess.Move, student_is_white:
     opponent_color = chess.WHITE if not student_is_white else chess.BLACK
 
     # 1. Does the piece attack a student's high-value piece?
-    attacked = after_board.attacks(to_sq)
+    attacked = after_board.attacks_mask(to_sq)
     best_target: tuple[int, str] | None = None  # (value, description)
     student_color = chess.WHITE if student_is_white else chess.BLACK
-    for sq in attacked:
-        piece = after_board.piece_at(sq)
-        if piece is None or piece.color != student_color:
-            continue
-        val = _PIECE_VALUES.get(piece.piece_type, 0)
+    for sq in chess.SquareSet(attacked & after_board.occupied_co[student_color]):
+        target_type = after_board.piece_type_at(sq)
+        val = _PIECE_VALUES.get(target_type, 0)
         if val >= 3:  # only mention bishop+ targets
-            name = _PIECE_NAMES.get(piece.piece_type, "piece")
+            name = _PIECE_NAMES.get(target_type, "piece")
             sq_name = chess.square_name(sq)
             candidate = (val, f"targeting your {name} on {sq_name}")
             if best_target is None or val > best_target[0]:
@@ -375,12 +391,9 @@ def _move_insight(after_board: chess.Board, move: chess.Move, student_is_white:
         return "challenging the center"
 
     # 3. Does the piece defend an attacked friendly piece?
-    for sq in attacked:
-        piece = after_board.piece_at(sq)
-        if piece is None or piece.color != opponent_color:
-            continue
+    for sq in chess.SquareSet(attacked & after_board.occupied_co[opponent_color]):
         if after_board.is_attacked_by(student_color, sq):
-            name = _PIECE_NAMES.get(piece.piece_type, "piece")
+            name = _PIECE_NAMES.get(after_board.piece_type_at(sq), "piece")
             sq_name = chess.square_name(sq)
             return f"defending their {name} on {sq_name}"
 
@@ -513,14 +526,17 @@ async def build_coaching_tree(
     )
     # Re-sort decision_point children by interest_score (stored temporarily)
     # Take top candidates for validation
-    screen_nodes.sort(key=lambda n: getattr(n, '_interest_score', 0), reverse=True)
+    screen_nodes.sort(key=lambda n: n._interest_score, reverse=True)
     top_candidates = screen_nodes[:profile.validate_breadth]
 
-    # 4. Validate: deep eval on top candidates
+    # 4. Validate: deep eval on top candidates, one at a time. The engine
+    # runs a single search at a time anyway, and awaiting in turn means a
+    # failed search doesn't leave the rest queued on the engine.
     for node in top_candidates:
-        temp = board_before.copy()
-        temp.push(node.move)
-        deep_eval = await engine.evaluate(temp.fen(), depth=profile.validate_depth)
+        board_before.push(node.move)
+        fen = board_before.fen()
+        board_before.pop()
+        deep_eval = await engine.evaluate(fen, depth=profile.validate_depth)
 
         # Update scores from deep eval
         node.score_cp = deep_eval.score_cp
@@ -579,9 +595,10 @@ async def _add_player_move_async(
             child.source = "played"
             return
 
-    temp = board_before.copy()
-    temp.push(player_move)
-    player_eval = await engine.evaluate(temp.fen(), depth=profile.validate_depth)
+    board_before.push(player_move)
+    player_fen = board_before.fen()
+    board_before.pop()
+    player_eval = await engine.evaluate(player_fen, depth=profile.validate_depth)
 
     player_node = tree.decision_point.add_child(
         player_move, source="played",
@@ -639,6 +656,7 @@ async def enrich_node_mate_threats(node: GameNode, engine: EngineProtocol) -> No
         for t in deep_threats
     ]
     node._tactics = replace(node.tactics, mate_threats=new_threats)
+    node._tactic_keys = None
 
 
 def _rank_nodes_by_teachability(
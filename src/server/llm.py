@@ -46,6 +46,13 @@ class ChessTeacher:
         self._model = model
         self._api_key = api_key
         self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _build_system_prompt(
         self,
@@ -150,16 +157,19 @@ class ChessTeacher:
             "model": self._model,
             "messages": messages,
         }
+        # One pooled client per teacher, so keepalive connections are reused.
+        if self._client is None:
+            self._client = httpx.AsyncClient()
         try:
-            async with httpx.AsyncClient(timeout=t) as client:
-                resp = await client.post(
-                    f"{self._base_url}/v1/chat/completions",
-                    json=payload,
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                return data["choices"][0]["message"]["content"]
+            resp = await self._client.post(
+                f"{self._base_url}/v1/chat/completions",
+                json=payload,
+                headers=headers,
+                timeout=t,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            return data["choices"][0]["message"]["content"]
         except (httpx.HTTPError, KeyError, ValueError, TypeError, IndexError):
             return None
 
@@ -21,7 +21,7 @@ from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 
 from server.analysis import analyze
-from server.config import Settings
+from server.config import get_settings
 from server.engine import EngineAnalysis, EngineProtocol
 from server.ws_engine import WebSocketEngine
 from server.game import GameManager
@@ -39,7 +39,7 @@ from server.rag import ChessRAG
 
 logger = logging.getLogger(__name__)
 
-settings = Settings()
+settings = get_settings()
 
 # --- Initialization status tracking ---
 
@@ -66,7 +66,9 @@ if settings.stockfish_mode == "browser":
 else:
     _ws_engine = None
     engine: EngineProtocol = EngineAnalysis(
-        stockfish_path=settings.stockfish_path, hash_mb=settings.stockfish_hash_mb
+        stockfish_path=settings.stockfish_path,
+        hash_mb=settings.stockfish_hash_mb,
+        threads=settings.stockfish_threads,
     )
 teacher = ChessTeacher(
     base_url=settings.llm_base_url,
@@ -170,6 +172,12 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+async def _signal_ready(tasks: list[asyncio.Task], ready: asyncio.Event) -> None:
+    """Set ``ready`` once every init task has finished, successfully or not."""
+    await asyncio.gather(*tasks, return_exceptions=True)
+    ready.set()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Launch all init tasks in background
@@ -178,6 +186,8 @@ async def lifespan(app: FastAPI):
         asyncio.create_task(_init_chromadb()),
         asyncio.create_task(_init_puzzles()),
     ]
+    app.state.ready = asyncio.Event()
+    tasks.append(asyncio.create_task(_signal_ready(tasks[:], app.state.ready)))
     yield
     # Cleanup: cancel background tasks and wait for them to finish
     for t in tasks:
@@ -185,6 +195,7 @@ async def lifespan(app: FastAPI):
     # Wait for all tasks to complete cancellation
     await asyncio.gather(*tasks, return_exceptions=True)
     await puzzle_db.close()
+    await teacher.aclose()
     if settings.stockfish_mode != "browser":
         await engine.stop()
 
@@ -8,13 +8,13 @@ from __future__ import annotations
 import asyncio
 import os
 
-from server.config import Settings
+from server.config import get_settings
 from server.knowledge import seed_knowledge_base
 from server.rag import ChessRAG
 
 
 async def main() -> None:
-    settings = Settings()
+    settings = get_settings()
     data_path = os.path.join(os.path.dirname(__file__), "..", "..", "data", "knowledge_base.json")
     rag = ChessRAG(
         base_url=settings.effective_embed_base_url,
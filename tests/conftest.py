@@ -0,0 +1,59 @@
+"""Shared pytest configuration.
+
+The LLM environment defaults here are applied before any test module
+imports ``server.main`` (whose module-level ``get_settings()`` reads them).
+"""
+
+import asyncio
+import contextlib
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Settings requires these env vars at import time
+os.environ.setdefault("LLM_BASE_URL", "http://localhost:11434")
+os.environ.setdefault("LLM_MODEL", "test-model")
+
+
+@pytest.fixture(scope="session")
+def engine_hash_mb() -> int:
+    """Stockfish hash size for tests that start an engine.
+
+    Test positions are trivial, so unless STOCKFISH_HASH_MB says otherwise
+    a small 8 MB table is used; it is allocated faster and uses less memory
+    than the production default.
+    """
+    return int(os.environ.get("STOCKFISH_HASH_MB", "8"))
+
+
+@pytest.fixture(scope="session")
+def client(engine_hash_mb):
+    """One app lifespan (and one Stockfish process) for the whole run.
+
+    API tests each start their own game session, so no server state needs
+    resetting between them.
+    """
+    from server import main
+
+    with pytest.MonkeyPatch.context() as mp:
+        # The engine is built when server.main is imported; size its hash
+        # before the lifespan starts it.
+        mp.setattr(main.engine, "_hash_mb", engine_hash_mb)
+        with TestClient(main.app) as c:
+            # Wait for background init tasks to finish (stockfish, chromadb, puzzles)
+            async def _wait_ready():
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(main.app.state.ready.wait(), timeout=30)
+
+            c.portal.call(_wait_ready)
+            yield c
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--dump-prompts",
+        action="store_true",
+        default=False,
+        help="Print generated coaching prompts (use with -s).",
+    )
@@ -328,6 +328,7 @@ async def run_batch(scenarios, profile_name="intermediate"):
                 results.append({"name": s["name"], "error": str(e)})
     finally:
         await engine.stop()
+        await teacher.aclose()
 
     return results
 
@@ -0,0 +1,39 @@
+"""Test doubles shared across test modules."""
+
+from server.engine import Evaluation, LineInfo, MoveInfo
+
+
+class FakeEngine:
+    """Async engine stub serving canned results.
+
+    analyze_lines serves ``lines`` in call order, repeating the last entry.
+    evaluate serves ``evaluations`` in call order, then keeps returning
+    ``evaluation``. best_moves always returns ``moves``; there are never
+    any mate threats.
+    """
+
+    def __init__(
+        self,
+        *lines: list[LineInfo],
+        evaluations: tuple[Evaluation, ...] = (),
+        evaluation: Evaluation | None = None,
+        moves: tuple[MoveInfo, ...] = (),
+    ):
+        self.lines = list(lines) or [[]]
+        self._evaluations = iter(evaluations)
+        self.evaluation = evaluation
+        self.moves = moves
+
+    async def evaluate(self, fen: str, depth: int = 20) -> Evaluation | None:
+        return next(self._evaluations, self.evaluation)
+
+    async def analyze_lines(self, fen: str, n: int = 5, depth: int = 16) -> list[LineInfo]:
+        if len(self.lines) > 1:
+            return list(self.lines.pop(0))
+        return list(self.lines[0])
+
+    async def best_moves(self, fen: str, n: int = 3, depth: int = 20) -> list[MoveInfo]:
+        return list(self.moves)
+
+    async def find_mate_threats(self, fen: str, max_depth: int = 3, eval_depth: int = 10) -> list[dict]:
+        return []
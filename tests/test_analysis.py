@@ -522,6 +522,15 @@ class TestTactics:
         pin = t.pins[0]
         assert pin.is_absolute is True
 
+    def test_motifs_are_frozen_and_valued(self):
+        """Detected motifs carry their value and cannot be mutated."""
+        import dataclasses
+        t = analyze_tactics(chess.Board(PIN_POSITION))
+        pin = t.pins[0]
+        assert pin.value is not None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pin.value = None
+
     def test_fork(self):
         board = chess.Board(FORK_POSITION)
         t = analyze_tactics(board)
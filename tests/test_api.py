@@ -1,44 +1,3 @@
-import time
-import pytest
-from fastapi.testclient import TestClient
-
-
-@pytest.fixture(scope="module", autouse=True)
-def set_test_env(monkeypatch_module):
-    """Set test environment variables for API tests."""
-    monkeypatch_module.setenv("LLM_BASE_URL", "http://localhost:11434")
-    monkeypatch_module.setenv("LLM_MODEL", "test-model")
-
-
-@pytest.fixture(scope="module")
-def monkeypatch_module():
-    """Module-scoped monkeypatch fixture."""
-    from _pytest.monkeypatch import MonkeyPatch
-    m = MonkeyPatch()
-    yield m
-    m.undo()
-
-
-@pytest.fixture()
-def app():
-    """Import app within fixture to ensure env vars are set first."""
-    from server.main import app as _app
-    return _app
-
-
-@pytest.fixture()
-def client(app):
-    with TestClient(app) as c:
-        # Wait for background init tasks to finish (stockfish, chromadb, puzzles)
-        deadline = time.monotonic() + 30
-        while time.monotonic() < deadline:
-            resp = c.get("/api/status")
-            if resp.status_code == 200 and resp.json().get("ready"):
-                break
-            time.sleep(0.2)
-        yield c
-
-
 def test_health(client):
     response = client.get("/api/health")
     assert response.status_code == 200
@@ -9,9 +9,13 @@ Covers:
 - End-to-end: analyze_tactics + render_motifs pipeline
 """
 
-import time
+from collections import Counter
+from dataclasses import replace
+from itertools import chain
+from timeit import Timer
 
 import chess
+import pytest
 
 from server.analysis.tactics import analyze_tactics
 from server.analysis.tactics.types import (
@@ -24,6 +28,7 @@ from server.analysis.tactics.types import (
 )
 from server.motifs import (
     RenderContext,
+    RenderedMotif,
     _detect_pin_hanging_chains,
     _render_chain_merged,
     render_motifs,
@@ -39,6 +44,12 @@ def _ctx(student_is_white=True) -> RenderContext:
     )
 
 
+def _summarize(opps, thrs, obs) -> tuple[Counter, list[RenderedMotif]]:
+    """Count diff_keys across all render buckets in one pass."""
+    all_items = list(chain(opps, thrs, obs))
+    return Counter(r.diff_key for r in all_items), all_items
+
+
 def _make_pin_hanging_tactics(
     defense_notes: str = "defender N on d7 pinned to d8",
 ) -> TacticalMotifs:
@@ -61,42 +72,65 @@ def _make_pin_hanging_tactics(
     return TacticalMotifs(pins=[pin], hanging=[hanging])
 
 
+# A moderately complex TacticalMotifs for the chain-detection timing test
+_PERF_TACTICS = TacticalMotifs(
+    pins=[
+        Pin(f"p{i}", "n", f"a{i}", "R", f"k{i}", "k",
+            True, "white", TacticValue(300, True))
+        for i in range(1, 9)
+    ],
+    hanging=[
+        HangingPiece(f"h{i}", "b", [f"x{i}"], "black", False,
+                     TacticValue(300, True, defense_notes=f"defender N on p{i} pinned to k{i}"))
+        for i in range(1, 5)
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def pin_hanging_tactics() -> TacticalMotifs:
+    """Default pin+hanging motifs, built once and shared read-only.
+
+    TacticalMotifs is frozen; a test that needs extra motifs derives a new
+    instance with dataclasses.replace instead of mutating this one.
+    """
+    return _make_pin_hanging_tactics()
+
+
 # ---------------------------------------------------------------------------
 # Chain detection tests
 # ---------------------------------------------------------------------------
 
 
 class TestChainDetection:
-    def test_chain_disabled_returns_empty(self, monkeypatch):
+    def test_chain_disabled_returns_empty(self, monkeypatch, pin_hanging_tactics):
         """Flag off → no chains detected."""
         monkeypatch.delenv("CHESS_TEACHER_ENABLE_CHAINING", raising=False)
-        tactics = _make_pin_hanging_tactics()
+        tactics = pin_hanging_tactics
         chains = _detect_pin_hanging_chains(tactics)
         assert chains == {}
 
-    def test_chain_enabled_detects_link(self, monkeypatch):
+    def test_chain_enabled_detects_link(self, monkeypatch, pin_hanging_tactics):
         """Flag on → pin->hanging chain detected."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics()
+        tactics = pin_hanging_tactics
         chains = _detect_pin_hanging_chains(tactics)
         assert len(chains) == 1
         pin_key = ("pin", "d1", "d7", "d8", True)
         hanging_key = ("hanging", "f5", "b", "black")
         assert chains[pin_key] == hanging_key
 
-    def test_chain_only_with_defense_notes(self, monkeypatch):
-        """Pin + hanging without defense_notes → no merge even with flag on."""
-        monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics(defense_notes="")
-        chains = _detect_pin_hanging_chains(tactics)
-        assert chains == {}
-
-    def test_chain_no_match_wrong_square(self, monkeypatch):
-        """Defense notes mention a square not matching any pin → no chain."""
+    @pytest.mark.parametrize("defense_notes", [
+        # No defense_notes → no merge even with flag on
+        "",
+        # Notes mention c6, which doesn't match the pin's pinned_square (d7)
+        "defender N on c6 pinned to e8",
+    ])
+    def test_chain_requires_matching_defense_notes(self, monkeypatch, defense_notes):
+        """Pin + hanging without a matching defense_notes link → no chain."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics(defense_notes="defender N on c6 pinned to e8")
+        tactics = _make_pin_hanging_tactics(defense_notes=defense_notes)
         chains = _detect_pin_hanging_chains(tactics)
-        # c6 doesn't match the pin's pinned_square (d7)
         assert chains == {}
 
 
@@ -106,51 +140,49 @@ class TestChainDetection:
 
 
 class TestChainRendering:
-    def test_chain_disabled_renders_separately(self, monkeypatch):
+    def test_chain_disabled_renders_separately(self, monkeypatch, pin_hanging_tactics):
         """Flag off → pin and hanging render as 2 separate items."""
         monkeypatch.delenv("CHESS_TEACHER_ENABLE_CHAINING", raising=False)
-        tactics = _make_pin_hanging_tactics()
+        tactics = pin_hanging_tactics
         ctx = _ctx(True)
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging"}, ctx,
         )
-        all_items = opps + thrs + obs
-        diff_keys = [r.diff_key for r in all_items]
+        diff_keys, all_items = _summarize(opps, thrs, obs)
         assert "pin" in diff_keys
         assert "hanging" in diff_keys
         assert len(all_items) == 2
 
-    def test_chain_enabled_merges(self, monkeypatch):
+    def test_chain_enabled_merges(self, monkeypatch, pin_hanging_tactics):
         """Flag on → 1 merged item, text mentions both pin and "undefended"."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics()
+        tactics = pin_hanging_tactics
         ctx = _ctx(True)
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging"}, ctx,
         )
-        all_items = opps + thrs + obs
+        _, all_items = _summarize(opps, thrs, obs)
         # Should be 1 merged item (pin), hanging is suppressed
         assert len(all_items) == 1
         text = all_items[0].text.lower()
         assert "pins" in text
         assert "undefended" in text
 
-    def test_chain_suppresses_hanging_duplicate(self, monkeypatch):
+    def test_chain_suppresses_hanging_duplicate(self, monkeypatch, pin_hanging_tactics):
         """Hanging piece does NOT appear separately when merged."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics()
+        tactics = pin_hanging_tactics
         ctx = _ctx(True)
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging"}, ctx,
         )
-        all_items = opps + thrs + obs
-        diff_keys = [r.diff_key for r in all_items]
+        diff_keys, all_items = _summarize(opps, thrs, obs)
         assert "hanging" not in diff_keys
 
-    def test_chain_hanging_key_in_rendered_keys(self, monkeypatch):
+    def test_chain_hanging_key_in_rendered_keys(self, monkeypatch, pin_hanging_tactics):
         """Both pin key AND hanging key appear in rendered_keys."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics()
+        tactics = pin_hanging_tactics
         ctx = _ctx(True)
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging"}, ctx,
@@ -160,22 +192,20 @@ class TestChainRendering:
         assert pin_key in rendered_keys
         assert hanging_key in rendered_keys
 
-    def test_chain_preserves_unrelated_motifs(self, monkeypatch):
+    def test_chain_preserves_unrelated_motifs(self, monkeypatch, pin_hanging_tactics):
         """Forks, skewers etc. unaffected by chain merging."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
-        tactics = _make_pin_hanging_tactics()
         # Add an unrelated fork
-        tactics.forks.append(Fork(
+        tactics = replace(pin_hanging_tactics, forks=[Fork(
             forking_square="e5", forking_piece="N",
             targets=["c6", "g6"], target_pieces=["r", "q"],
             color="white",
-        ))
+        )])
         ctx = _ctx(True)
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging", "fork"}, ctx,
         )
-        all_items = opps + thrs + obs
-        diff_keys = [r.diff_key for r in all_items]
+        diff_keys, all_items = _summarize(opps, thrs, obs)
         assert "fork" in diff_keys
         # Pin is merged (present), hanging is suppressed (absent)
         assert "pin" in diff_keys
@@ -248,7 +278,7 @@ class TestE2EChaining:
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging"}, ctx,
         )
-        all_items = opps + thrs + obs
+        _, all_items = _summarize(opps, thrs, obs)
         assert len(all_items) == 1
         text = all_items[0].text.lower()
         assert "pins" in text
@@ -311,37 +341,20 @@ class TestE2EChaining:
         opps, thrs, obs, rendered_keys = render_motifs(
             tactics, {"pin", "hanging"}, ctx,
         )
-        all_items = opps + thrs + obs
+        diff_keys, all_items = _summarize(opps, thrs, obs)
         # 2 items: 1 merged pin+hanging, 1 standalone pin
         assert len(all_items) == 2
-        diff_keys = [r.diff_key for r in all_items]
-        assert diff_keys.count("pin") == 2  # both are "pin" diff_key
+        assert diff_keys["pin"] == 2  # both are "pin" diff_key
         # One should mention "undefended", the other should not
-        merged = [r for r in all_items if "undefended" in r.text.lower()]
-        standalone = [r for r in all_items if "undefended" not in r.text.lower()]
-        assert len(merged) == 1
-        assert len(standalone) == 1
+        merged = sum("undefended" in r.text.lower() for r in all_items)
+        assert merged == 1
 
     def test_performance_chain_detection(self, monkeypatch):
         """Chain detection on a complex position completes in < 1ms."""
         monkeypatch.setenv("CHESS_TEACHER_ENABLE_CHAINING", "1")
 
-        # Build a moderately complex TacticalMotifs
-        pins = [
-            Pin(f"p{i}", "n", f"a{i}", "R", f"k{i}", "k",
-                True, "white", TacticValue(300, True))
-            for i in range(1, 9)
-        ]
-        hanging = [
-            HangingPiece(f"h{i}", "b", [f"x{i}"], "black", False,
-                         TacticValue(300, True, defense_notes=f"defender N on p{i} pinned to k{i}"))
-            for i in range(1, 5)
-        ]
-        tactics = TacticalMotifs(pins=pins, hanging=hanging)
-
-        start = time.perf_counter()
-        for _ in range(100):
-            _detect_pin_hanging_chains(tactics)
-        elapsed = (time.perf_counter() - start) / 100
+        # autorange picks the loop count so timer resolution doesn't dominate
+        n, total = Timer(lambda: _detect_pin_hanging_chains(_PERF_TACTICS)).autorange()
+        elapsed = total / n
 
         assert elapsed < 0.001, f"Chain detection took {elapsed*1000:.3f}ms, expected < 1ms"
@@ -1,5 +1,7 @@
 """Tests for the coaching assessment module."""
 
+import functools
+
 import chess
 import pytest
 
@@ -13,7 +15,8 @@ from server.coach import (
 from server.engine import Evaluation
 
 
-# Helper to create eval objects
+# Helper to create eval objects. Cached, so callers must not mutate the result.
+@functools.lru_cache(maxsize=None)
 def _eval(cp: int | None = None, mate: int | None = None) -> Evaluation:
     return Evaluation(
         score_cp=cp,
@@ -24,97 +27,70 @@ def _eval(cp: int | None = None, mate: int | None = None) -> Evaluation:
     )
 
 
-# ---------------------------------------------------------------------------
-# Move quality classification
-# ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _fen_board(fen: str) -> chess.Board:
+    """Parse each FEN once. Copy the result before pushing moves on it."""
+    return chess.Board(fen)
 
 
-class TestMoveQuality:
-    def test_blunder(self):
-        """Move losing >200cp is a blunder."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
-        result = assess_move(
-            board_before=board_before,
-            board_after=board_after,
-            player_move_uci="e2e4",
-            eval_before=_eval(cp=50),
-            eval_after=_eval(cp=-200),
-            best_move_uci="d2d4",
-        )
-        assert result is not None
-        assert result.quality == MoveQuality.BLUNDER
+@pytest.fixture(scope="module")
+def std_boards() -> tuple[chess.Board, chess.Board]:
+    """Starting position and the position after 1. e4.
 
-    def test_mistake(self):
-        """Move losing 100-200cp is a mistake."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
-        result = assess_move(
-            board_before=board_before,
-            board_after=board_after,
-            player_move_uci="e2e4",
-            eval_before=_eval(cp=50),
-            eval_after=_eval(cp=-80),
-            best_move_uci="d2d4",
-        )
-        assert result is not None
-        assert result.quality == MoveQuality.MISTAKE
+    Shared across the module — assess_move leaves its boards unchanged.
+    """
+    board_before = chess.Board()
+    board_after = board_before.copy(stack=False)
+    board_after.push_uci("e2e4")
+    return board_before, board_after
 
-    def test_inaccuracy(self):
-        """Move losing 50-100cp is an inaccuracy."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
-        result = assess_move(
-            board_before=board_before,
-            board_after=board_after,
-            player_move_uci="e2e4",
-            eval_before=_eval(cp=30),
-            eval_after=_eval(cp=-40),
-            best_move_uci="d2d4",
-        )
-        assert result is not None
-        assert result.quality == MoveQuality.INACCURACY
 
-    def test_good_move_returns_none(self):
-        """Routine good move returns None (coach stays silent)."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
-        result = assess_move(
-            board_before=board_before,
-            board_after=board_after,
-            player_move_uci="e2e4",
-            eval_before=_eval(cp=30),
-            eval_after=_eval(cp=25),
-            best_move_uci="e2e4",
-        )
-        assert result is None
+# ---------------------------------------------------------------------------
+# Move quality classification
+# ---------------------------------------------------------------------------
 
-    def test_best_move_in_sharp_position_is_brilliant(self):
-        """Playing the only good move when alternatives lose big is brilliant."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
+
+class TestMoveQuality:
+    @pytest.mark.parametrize("eval_before,eval_after,best_move_uci,sharp,expected", [
+        # Move losing >200cp is a blunder
+        ((50, None), (-200, None), "d2d4", False, MoveQuality.BLUNDER),
+        # Move losing 100-200cp is a mistake
+        ((50, None), (-80, None), "d2d4", False, MoveQuality.MISTAKE),
+        # Move losing 50-100cp is an inaccuracy
+        ((30, None), (-40, None), "d2d4", False, MoveQuality.INACCURACY),
+        # Routine good move returns None (coach stays silent)
+        ((30, None), (25, None), "e2e4", False, None),
+        # Playing the only good move when alternatives lose big is brilliant
+        ((200, None), (210, None), "e2e4", True, MoveQuality.BRILLIANT),
+        # If eval_before had mate and eval_after doesn't, it's a blunder
+        ((None, 3), (100, None), "d2d4", False, MoveQuality.BLUNDER),
+    ], ids=["blunder", "mistake", "inaccuracy", "good_move_silent",
+            "sharp_best_move_brilliant", "missed_mate_blunder"])
+    def test_quality_classification(
+        self, std_boards, eval_before, eval_after, best_move_uci, sharp, expected,
+    ):
+        """White plays 1. e4; quality follows from the eval swing."""
+        board_before, board_after = std_boards
         result = assess_move(
             board_before=board_before,
             board_after=board_after,
             player_move_uci="e2e4",
-            eval_before=_eval(cp=200),
-            eval_after=_eval(cp=210),
-            best_move_uci="e2e4",
-            position_is_sharp=True,
+            eval_before=_eval(*eval_before),
+            eval_after=_eval(*eval_after),
+            best_move_uci=best_move_uci,
+            position_is_sharp=sharp,
         )
-        assert result is not None
-        assert result.quality == MoveQuality.BRILLIANT
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result.quality == expected
 
     def test_blunder_as_black(self):
         """Black's blunder is detected correctly."""
         # Position after 1. e4 — Black to move
-        board_before = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
-        board_after = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
+        board_before = _fen_board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
+        board_after = board_before.copy(stack=False)
         board_after.push_uci("f7f6")  # A bad move
         result = assess_move(
             board_before=board_before,
@@ -127,28 +103,10 @@ class TestMoveQuality:
         assert result is not None
         assert result.quality == MoveQuality.BLUNDER
 
-    def test_missed_mate_is_blunder(self):
-        """If eval_before had mate and eval_after doesn't, it's a blunder."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
-        result = assess_move(
-            board_before=board_before,
-            board_after=board_after,
-            player_move_uci="e2e4",
-            eval_before=_eval(mate=3),
-            eval_after=_eval(cp=100),
-            best_move_uci="d2d4",
-        )
-        assert result is not None
-        assert result.quality == MoveQuality.BLUNDER
-
 
 class TestCoachingResponse:
-    def test_blunder_has_message(self):
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
+    def test_blunder_has_message(self, std_boards):
+        board_before, board_after = std_boards
         result = assess_move(
             board_before=board_before,
             board_after=board_after,
@@ -161,11 +119,9 @@ class TestCoachingResponse:
         assert isinstance(result.message, str)
         assert len(result.message) > 0
 
-    def test_blunder_has_arrows(self):
+    def test_blunder_has_arrows(self, std_boards):
         """Blunder should show the best move as a green arrow."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
+        board_before, board_after = std_boards
         result = assess_move(
             board_before=board_before,
             board_after=board_after,
@@ -179,12 +135,10 @@ class TestCoachingResponse:
         best_arrow = [a for a in result.arrows if a.brush == "green"]
         assert len(best_arrow) > 0
 
-    def test_response_serializable(self):
+    def test_response_serializable(self, std_boards):
         """CoachingResponse should be convertible to dict."""
         from dataclasses import asdict
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
+        board_before, board_after = std_boards
         result = assess_move(
             board_before=board_before,
             board_after=board_after,
@@ -204,8 +158,8 @@ class TestCoachingResponse:
 class TestTacticalCoaching:
     def test_hanging_piece_coaching(self):
         """When player leaves a piece hanging, coach should warn about it."""
-        board_before = chess.Board("r1bqkb1r/pppppppp/2n2n2/4N3/2B5/8/PPPP1PPP/RNBQK2R b KQkq - 0 4")
-        board_after = chess.Board("r1bqkb1r/pppppppp/2n2n2/4N3/2B5/8/PPPP1PPP/RNBQK2R b KQkq - 0 4")
+        board_before = _fen_board("r1bqkb1r/pppppppp/2n2n2/4N3/2B5/8/PPPP1PPP/RNBQK2R b KQkq - 0 4")
+        board_after = board_before  # identical FEN; assess_move only reads boards
         # Black to move. Evals from White's POV: before=-50 (Black slightly
         # better), after=100 (White now better) => Black lost 150cp.
         result = assess_move(
@@ -221,8 +175,8 @@ class TestTacticalCoaching:
 
     def test_fork_detection_in_coaching(self):
         """When a fork exists after the move, coaching mentions it."""
-        board_before = chess.Board("r3k3/8/8/2N5/8/8/8/4K3 w q - 0 1")
-        board_after = chess.Board("r3k3/2N5/8/8/8/8/8/4K3 b q - 1 1")
+        board_before = _fen_board("r3k3/8/8/2N5/8/8/8/4K3 w q - 0 1")
+        board_after = _fen_board("r3k3/2N5/8/8/8/8/8/4K3 b q - 1 1")
         result = assess_move(
             board_before=board_before,
             board_after=board_after,
@@ -238,11 +192,9 @@ class TestTacticalCoaching:
 
 
 class TestTacticsSummaryField:
-    def test_coaching_response_has_tactics_summary(self):
+    def test_coaching_response_has_tactics_summary(self, std_boards):
         """CoachingResponse includes tactics_summary field."""
-        board_before = chess.Board()
-        board_after = chess.Board()
-        board_after.push_uci("e2e4")
+        board_before, board_after = std_boards
         result = assess_move(
             board_before=board_before,
             board_after=board_after,
@@ -6,6 +6,24 @@ not the hardcoded default.
 
 from server.prompts.personas import get_persona
 
+# Coach names offered by the frontend dropdown (src/frontend/main.ts)
+FRONTEND_COACHES = (
+    "Anna Cramling",
+    "Daniel Naroditsky",
+    "GothamChess",
+    "GM Ben Finegold",
+    "Hikaru",
+    "Judit Polgar",
+    "Magnus Carlsen",
+    "Vishy Anand",
+    "Garry Kasparov",
+    "Mikhail Botvinnik",
+    "Paul Morphy",
+    "Mikhail Tal",
+    "Jose Raul Capablanca",
+    "Faustino Oro",
+)
+
 
 def test_persona_lookup_works():
     """Verify backend persona lookup works correctly."""
@@ -23,23 +41,6 @@ def test_default_fallback():
 
 def test_all_coaches_in_frontend_exist_in_backend():
     """Verify all coaches in frontend dropdown exist in backend."""
-    frontend_coaches = [
-        "Anna Cramling",
-        "Daniel Naroditsky",
-        "GothamChess",
-        "GM Ben Finegold",
-        "Hikaru",
-        "Judit Polgar",
-        "Magnus Carlsen",
-        "Vishy Anand",
-        "Garry Kasparov",
-        "Mikhail Botvinnik",
-        "Paul Morphy",
-        "Mikhail Tal",
-        "Jose Raul Capablanca",
-        "Faustino Oro",
-    ]
-
-    for coach_name in frontend_coaches:
+    for coach_name in FRONTEND_COACHES:
         persona = get_persona(coach_name)
         assert persona.name == coach_name, f"Coach {coach_name} not found in backend"
@@ -3,7 +3,15 @@
 import os
 import pytest
 from pydantic import ValidationError
-from server.config import Settings
+from server.config import Settings, get_settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings_cache():
+    """Each test sees its own environment, not a cached Settings."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
 
 
 class TestSettings:
@@ -24,6 +32,7 @@ class TestSettings:
         assert s.llm_model == "qwen2.5:14b"
         assert s.llm_api_key is None
         assert s.stockfish_hash_mb == 64
+        assert s.stockfish_threads == 1
 
     def test_embed_base_url_falls_back_to_llm(self, monkeypatch):
         """When EMBED_BASE_URL is not set, use LLM_BASE_URL."""
@@ -60,10 +69,32 @@ class TestSettings:
         monkeypatch.setenv("EMBED_API_KEY", "sk-tog-xxx")
         monkeypatch.setenv("STOCKFISH_PATH", "/usr/games/stockfish")
         monkeypatch.setenv("STOCKFISH_HASH_MB", "256")
+        monkeypatch.setenv("STOCKFISH_THREADS", "4")
         monkeypatch.setenv("CHROMADB_DIR", "/data/chromadb")
         monkeypatch.setenv("PUZZLE_DB_PATH", "/data/puzzles.db")
         monkeypatch.setenv("AUTO_INIT_PUZZLES", "false")
         s = Settings(_env_file=None)
         assert s.llm_timeout == 60.0
         assert s.stockfish_hash_mb == 256
+        assert s.stockfish_threads == 4
         assert s.auto_init_puzzles is False
+
+    def test_frozen(self, monkeypatch):
+        """Settings cannot be mutated after construction."""
+        monkeypatch.setenv("LLM_BASE_URL", "http://localhost:11434")
+        monkeypatch.setenv("LLM_MODEL", "qwen2.5:14b")
+        s = Settings(_env_file=None)
+        with pytest.raises(ValidationError):
+            s.llm_model = "other"
+
+
+class TestGetSettings:
+    def test_cached(self, monkeypatch):
+        """get_settings reads the environment once and reuses the result."""
+        monkeypatch.setenv("LLM_BASE_URL", "http://localhost:11434")
+        monkeypatch.setenv("LLM_MODEL", "qwen2.5:14b")
+        first = get_settings()
+        monkeypatch.setenv("LLM_MODEL", "other")
+        assert get_settings() is first
+        get_settings.cache_clear()
+        assert get_settings().llm_model == "other"
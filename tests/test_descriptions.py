@@ -1,6 +1,9 @@
 """Tests for descriptions.py — tactic diffing, describe functions."""
 
+import functools
+
 import chess
+import pytest
 
 from server.analysis import (
     DiscoveredAttack,
@@ -9,7 +12,6 @@ from server.analysis import (
     Pin,
     TacticalMotifs,
 )
-from server.analysis import analyze
 from server.descriptions import (
     PositionDescription,
     _blocker_is_move_dest,
@@ -22,13 +24,73 @@ from server.descriptions import (
 )
 from server.game_tree import GameNode, GameTree
 
+# Shared "nothing detected" tactics. TacticalMotifs is frozen and
+# describe_changes only reads the lists, so one instance serves every test.
+_NO_TACTICS = TacticalMotifs()
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed_board(fen: str) -> chess.Board:
+    return chess.Board(fen)
+
+
+def _board(fen: str = chess.STARTING_FEN) -> chess.Board:
+    """A fresh board for *fen*. Each FEN is parsed once per module."""
+    return _parsed_board(fen).copy(stack=False)
+
+
+def _contains_ci(needles: str | tuple[str, ...], *lists: list[str]) -> bool:
+    """True if any string in *lists* contains any of *needles*, ignoring case.
+
+    Each string is lowercased once, however many needles are checked.
+    """
+    if isinstance(needles, str):
+        needles = (needles,)
+    needles = tuple(n.lower() for n in needles)
+    for lst in lists:
+        for s in lst:
+            low = s.lower()
+            if any(n in low for n in needles):
+                return True
+    return False
+
+
+def _patched_chain(
+    fen: str, ucis: list[str], tactics: list[TacticalMotifs],
+) -> tuple[GameTree, list[GameNode]]:
+    """Build root -> ply0 -> ... with each node's tactics patched in.
+
+    Returns the tree (decision point at root) and [root, ply0, ...]. The
+    first move is the played move, later ones engine continuations. Tactics
+    are set before anything reads the nodes, so no cache goes stale.
+    """
+    root = GameNode(board=_board(fen), source="played")
+    nodes = [root]
+    for i, uci in enumerate(ucis):
+        source = "played" if i == 0 else "engine"
+        nodes.append(nodes[-1].add_child(chess.Move.from_uci(uci), source))
+    for node, node_tactics in zip(nodes, tactics, strict=True):
+        node._tactics = node_tactics
+    tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+    return tree, nodes
+
+
+@pytest.fixture(scope="module")
+def starting_tree() -> tuple[GameTree, GameNode]:
+    """Single-node tree at the starting position, built once per module.
+
+    Read-only: the root caches its analysis, so tests must not mutate it.
+    """
+    root = GameNode(board=chess.Board(), source="played")
+    return GameTree(root=root, decision_point=root, player_color=chess.WHITE), root
+
 
 # --- Tactic diffing tests ---
 
 class TestTacticDiff:
     def test_empty_to_pin(self):
         """Parent has no tactics, child has a pin → pin is new."""
-        parent = TacticalMotifs()
+        parent = _NO_TACTICS
         child = TacticalMotifs(pins=[
             Pin("N", "c6", "B", "b5", "e8", "k", True)
         ])
@@ -40,7 +102,7 @@ class TestTacticDiff:
         """Parent has a pin, child doesn't → pin resolved."""
         pin = Pin("N", "c6", "B", "b5", "e8", "k", True)
         parent = TacticalMotifs(pins=[pin])
-        child = TacticalMotifs()
+        child = _NO_TACTICS
         diff = diff_tactics(parent, child)
         assert len(diff.resolved_keys) == 1
         assert len(diff.new_keys) == 0
@@ -68,10 +130,9 @@ class TestTacticDiff:
 
 # --- describe_position tests ---
 
-def test_describe_position_returns_structured():
+def test_describe_position_returns_structured(starting_tree):
     """describe_position produces a PositionDescription."""
-    root = GameNode(board=chess.Board(), source="played")
-    tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+    tree, root = starting_tree
     desc = describe_position(tree, root)
     assert isinstance(desc, PositionDescription)
     assert isinstance(desc.threats, list)
@@ -81,10 +142,9 @@ def test_describe_position_returns_structured():
 
 # --- describe_changes tests ---
 
-def test_describe_changes_no_parent():
+def test_describe_changes_no_parent(starting_tree):
     """Root node returns empty 3-tuple."""
-    root = GameNode(board=chess.Board(), source="played")
-    tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+    tree, root = starting_tree
     opps, thrs, obs = describe_changes(tree, root)
     assert opps == []
     assert thrs == []
@@ -95,7 +155,7 @@ def test_describe_changes_with_pin():
     """Position where Nc3 creates a pin should report pin in changes."""
     # After 1.d4 e5 2.dxe5 Bb4+ — student plays Nc3 getting pinned
     fen = "rnbqk1nr/pppp1ppp/8/4P3/1b6/8/PPP1PPPP/RNBQKBNR w KQkq - 1 3"
-    board_before = chess.Board(fen)
+    board_before = _board(fen)
     root = GameNode(board=board_before, source="played")
 
     # Play Nc3
@@ -106,35 +166,31 @@ def test_describe_changes_with_pin():
     opps, thrs, obs = describe_changes(tree, child)
 
     # The pin should appear in the output (as threat since student's piece gets pinned)
-    all_text = " ".join(opps + thrs + obs).lower()
-    assert "pin" in all_text
+    assert _contains_ci("pin", opps, thrs, obs)
 
 
-def test_back_rank_filtered_early_game():
+def test_back_rank_filtered_early_game(starting_tree):
     """Starting position should have no back rank observations (both uncastled, move < 10)."""
-    root = GameNode(board=chess.Board(), source="played")
-    tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+    tree, root = starting_tree
     desc = describe_position(tree, root)
-    all_text = " ".join(desc.observations).lower()
-    assert "back rank" not in all_text
+    assert not _contains_ci("back rank", desc.observations)
 
 
 # --- describe_position_from_report tests ---
 
-def test_describe_position_from_report_returns_structured():
+def test_describe_position_from_report_returns_structured(starting_tree):
     """describe_position_from_report produces a PositionDescription."""
-    report = analyze(chess.Board())
-    desc = describe_position_from_report(report, student_is_white=True)
+    _, root = starting_tree
+    desc = describe_position_from_report(root.report, student_is_white=True)
     assert isinstance(desc, PositionDescription)
     assert isinstance(desc.threats, list)
     assert isinstance(desc.opportunities, list)
     assert isinstance(desc.observations, list)
 
 
-def test_describe_position_from_report_matches_describe_position():
+def test_describe_position_from_report_matches_describe_position(starting_tree):
     """describe_position_from_report should match describe_position output."""
-    root = GameNode(board=chess.Board(), source="played")
-    tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+    tree, root = starting_tree
     desc_tree = describe_position(tree, root)
     desc_report = describe_position_from_report(root.report, student_is_white=True)
     assert desc_tree.threats == desc_report.threats
@@ -317,35 +373,37 @@ class TestToPastTense:
         assert "cannot move" in result
 
 
+@pytest.fixture(scope="module")
+def queen_up_tree() -> tuple[GameTree, GameNode]:
+    """White up a queen (Ke1, Qd1 vs Ke8), guaranteeing a material observation.
+
+    Read-only and module-scoped, so the position is analyzed once.
+    """
+    root = GameNode(board=_board("4k3/8/8/8/8/8/8/3QK3 w - - 0 1"), source="played")
+    return GameTree(root=root, decision_point=root, player_color=chess.WHITE), root
+
+
 class TestDescribePositionTense:
     """Test that describe_position respects the tense parameter."""
 
-    def test_default_tense_is_present(self):
+    def test_default_tense_is_present(self, starting_tree):
         """Default (no tense arg) returns present tense — backward compatible."""
-        root = GameNode(board=chess.Board(), source="played")
-        tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+        tree, root = starting_tree
         desc = describe_position(tree, root)
         all_text = " ".join(desc.threats + desc.opportunities + desc.observations)
         # Should NOT contain past-tense markers
         assert "was " not in all_text or "was" not in all_text.split()
 
-    def test_past_tense_converts_observations(self):
+    def test_past_tense_converts_observations(self, queen_up_tree):
         """tense='past' should convert positional observations to past tense."""
-        # Use a position with material imbalance to guarantee an observation
-        # White up a queen: White Ke1, Qd1; Black Ke8
-        board = chess.Board("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
-        root = GameNode(board=board, source="played")
-        tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+        tree, root = queen_up_tree
         desc = describe_position(tree, root, tense="past")
-        all_obs = " ".join(desc.observations)
         # Material observation should use past tense
-        assert "was up approximately" in all_obs or "had" in all_obs
+        assert any("was up approximately" in o or "had" in o for o in desc.observations)
 
-    def test_present_tense_explicit(self):
+    def test_present_tense_explicit(self, queen_up_tree):
         """tense='present' returns present tense (same as default)."""
-        board = chess.Board("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
-        root = GameNode(board=board, source="played")
-        tree = GameTree(root=root, decision_point=root, player_color=chess.WHITE)
+        tree, root = queen_up_tree
         desc_default = describe_position(tree, root)
         desc_present = describe_position(tree, root, tense="present")
         assert desc_default.threats == desc_present.threats
@@ -371,27 +429,16 @@ def test_describe_changes_no_duplicate_persistent_motifs():
     child_tactics = TacticalMotifs(forks=[fork_a, fork_b])
 
     # Build a minimal tree with mocked tactics
-    parent_board = chess.Board()
-    parent_node = GameNode(board=parent_board, source="played")
-
-    move = chess.Move.from_uci("g1f3")
-    child_node = parent_node.add_child(move, "played")
-
-    tree = GameTree(
-        root=parent_node, decision_point=parent_node, player_color=chess.WHITE,
+    tree, (_, child_node) = _patched_chain(
+        chess.STARTING_FEN, ["g1f3"], [parent_tactics, child_tactics],
     )
 
-    # Patch tactics caches directly
-    parent_node._tactics = parent_tactics
-    child_node._tactics = child_tactics
-
     opps, thrs, obs = describe_changes(tree, child_node)
-    all_text = " ".join(opps + thrs + obs).lower()
-
     # Fork B (e4) should appear
-    assert "e4" in all_text, "New fork on e4 should be described"
+    assert _contains_ci("e4", opps, thrs, obs), "New fork on e4 should be described"
     # Fork A (d5) should NOT appear — it was persistent, not new
-    assert "d5" not in all_text, "Persistent fork on d5 should NOT be re-rendered"
+    assert not _contains_ci("d5", opps, thrs, obs), \
+        "Persistent fork on d5 should NOT be re-rendered"
 
 
 # --- False discovered attack tests (Bug #8) ---
@@ -424,7 +471,7 @@ class TestFalseDiscoveredAttack:
 
     def test_blocker_is_move_dest_non_discovered_key(self):
         """_blocker_is_move_dest returns False for non-discovered keys."""
-        tactics = TacticalMotifs()
+        tactics = _NO_TACTICS
         key = ("pin", "b5", "e8")
         assert _blocker_is_move_dest(key, tactics, "c6") is False
 
@@ -436,32 +483,25 @@ class TestFalseDiscoveredAttack:
         blocker=f6, but the bishop just arrived there — nothing was "discovered".
         """
         # Parent: White Qd4, Bg5; Black Nf6, pawns g7/h6
-        parent_board = chess.Board("4k3/6p1/5n1p/6B1/3Q4/8/8/4K3 w - - 0 1")
-        parent_node = GameNode(board=parent_board, source="played")
-
         # Move: Bxf6 (bishop captures on f6, landing on d4-g7 ray)
-        move = chess.Move.from_uci("g5f6")
-        child_node = parent_node.add_child(move, "played")
-
         # Patch tactics: parent has no discovered attacks, child has one
         # where the blocker (f6) is the move destination
-        parent_node._tactics = TacticalMotifs()
-        child_node._tactics = TacticalMotifs(discovered_attacks=[
-            DiscoveredAttack(
-                blocker_square="f6", blocker_piece="B",
-                slider_square="d4", slider_piece="Q",
-                target_square="g7", target_piece="p",
-                color="white",
-            ),
-        ])
-
-        tree = GameTree(
-            root=parent_node, decision_point=parent_node,
-            player_color=chess.WHITE,
+        tree, (_, child_node) = _patched_chain(
+            "4k3/6p1/5n1p/6B1/3Q4/8/8/4K3 w - - 0 1", ["g5f6"],
+            [
+                _NO_TACTICS,
+                TacticalMotifs(discovered_attacks=[
+                    DiscoveredAttack(
+                        blocker_square="f6", blocker_piece="B",
+                        slider_square="d4", slider_piece="Q",
+                        target_square="g7", target_piece="p",
+                        color="white",
+                    ),
+                ]),
+            ],
         )
         opps, thrs, obs = describe_changes(tree, child_node)
-        all_text = " ".join(opps + thrs + obs).lower()
-        assert "discover" not in all_text, \
+        assert not _contains_ci("discover", opps, thrs, obs), \
             "False discovered attack (blocker arrived at square) should be suppressed"
 
     def test_genuine_discovered_attack_preserved(self):
@@ -471,32 +511,25 @@ class TestFalseDiscoveredAttack:
         creating Ra1-Na4-Qa8 alignment). The blocker Na4 was NOT the piece
         that moved, so the discovered attack should survive filtering.
         """
-        parent_board = chess.Board("q3k3/8/8/8/N7/8/8/1R2K3 w - - 0 1")
-        parent_node = GameNode(board=parent_board, source="played")
-
         # Move: Rb1-a1 (rook moves, knight is already on a4)
-        move = chess.Move.from_uci("b1a1")
-        child_node = parent_node.add_child(move, "played")
-
         # Patch tactics: child has discovered attack with blocker=a4 (the knight)
-        parent_node._tactics = TacticalMotifs()
-        child_node._tactics = TacticalMotifs(discovered_attacks=[
-            DiscoveredAttack(
-                blocker_square="a4", blocker_piece="N",
-                slider_square="a1", slider_piece="R",
-                target_square="a8", target_piece="q",
-                color="white",
-            ),
-        ])
-
-        tree = GameTree(
-            root=parent_node, decision_point=parent_node,
-            player_color=chess.WHITE,
+        tree, (_, child_node) = _patched_chain(
+            "q3k3/8/8/8/N7/8/8/1R2K3 w - - 0 1", ["b1a1"],
+            [
+                _NO_TACTICS,
+                TacticalMotifs(discovered_attacks=[
+                    DiscoveredAttack(
+                        blocker_square="a4", blocker_piece="N",
+                        slider_square="a1", slider_piece="R",
+                        target_square="a8", target_piece="q",
+                        color="white",
+                    ),
+                ]),
+            ],
         )
         opps, thrs, obs = describe_changes(tree, child_node)
-        all_text = " ".join(opps + thrs + obs).lower()
         # The discovered attack should be preserved (blocker a4 != move dest a1)
-        assert "discover" in all_text or "x-ray" in all_text or "a4" in all_text, \
+        assert _contains_ci(("discover", "x-ray", "a4"), opps, thrs, obs), \
             "Genuine discovered attack (blocker already in place) should be preserved"
 
 
@@ -524,39 +557,26 @@ def test_remerging_motif_reported():
     Fixed behavior: rendered_keys from ply 0 does NOT contain hanging (it was
     suppressed). At ply 2, hanging is not in seen_motif_keys, so it's reported.
     """
-    parent_board = chess.Board()
-    parent_node = GameNode(board=parent_board, source="played")
-
-    move0 = chess.Move.from_uci("g1f3")
-    ply0 = parent_node.add_child(move0, "played")
-
-    move1 = chess.Move.from_uci("b8c6")
-    ply1 = ply0.add_child(move1, "engine")
-
-    move2 = chess.Move.from_uci("f3e5")
-    ply2 = ply1.add_child(move2, "engine")
-
     # Fork on d5 targeting c6 and g6 — hanging on c6 will be suppressed
     fork = Fork("d5", "N", ["c6", "g6"], ["r", "q"])
     hanging = HangingPiece(square="c6", piece="r", attacker_squares=["d5"], color="Black")
 
-    # Parent: no tactics
-    parent_node._tactics = TacticalMotifs()
-    # Ply 0: fork + hanging (hanging suppressed by fork-implies-hanging dedup)
-    ply0._tactics = TacticalMotifs(forks=[fork], hanging=[hanging])
-    # Ply 1: everything disappears
-    ply1._tactics = TacticalMotifs()
-    # Ply 2: hanging reappears alone (no fork to suppress it)
-    ply2._tactics = TacticalMotifs(hanging=[hanging])
-
-    tree = GameTree(
-        root=parent_node, decision_point=parent_node, player_color=chess.WHITE,
+    tree, (_, ply0, _, _) = _patched_chain(
+        chess.STARTING_FEN, ["g1f3", "b8c6", "f3e5"],
+        [
+            # Parent: no tactics
+            _NO_TACTICS,
+            # Ply 0: fork + hanging (hanging suppressed by fork-implies-hanging dedup)
+            TacticalMotifs(forks=[fork], hanging=[hanging]),
+            # Ply 1: everything disappears
+            _NO_TACTICS,
+            # Ply 2: hanging reappears alone (no fork to suppress it)
+            TacticalMotifs(hanging=[hanging]),
+        ],
     )
     opps, thrs, obs = describe_changes(tree, ply0, max_plies=3)
-    all_text = " ".join(opps + thrs + obs).lower()
-
     # The hanging piece at ply 2 should be reported
-    assert "hanging" in all_text or "undefended" in all_text, (
+    assert _contains_ci(("hanging", "undefended"), opps, thrs, obs), (
         f"Re-emerging hanging piece on c6 should be reported at ply 2, "
-        f"but was not found in: {all_text}"
+        f"but was not found in: {opps + thrs + obs}"
     )
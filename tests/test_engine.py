@@ -1,3 +1,6 @@
+import dataclasses
+from types import SimpleNamespace
+
 import chess
 import chess.engine
 import pytest
@@ -45,6 +48,35 @@ async def test_best_moves(engine):
         assert parsed in board.legal_moves
 
 
+@pytest.mark.parametrize("method", ["best_moves", "analyze_lines"])
+async def test_multipv_queries_cached_per_position(method):
+    """Repeating a multi-PV query reuses the first search's result."""
+    e = EngineAnalysis()
+    calls = 0
+
+    async def analyse(board, limit, **kwargs):
+        nonlocal calls
+        calls += 1
+        return [{
+            "score": chess.engine.PovScore(chess.engine.Cp(20), chess.WHITE),
+            "pv": [chess.Move.from_uci("e2e4"), chess.Move.from_uci("e7e5")],
+        }]
+
+    e._engine = SimpleNamespace(analyse=analyse)
+    query = getattr(e, method)
+    first = await query(chess.STARTING_FEN, n=1, depth=5)
+    second = await query(chess.STARTING_FEN, n=1, depth=5)
+    assert calls == 1
+    assert first == second
+    assert first is not second
+    assert first[0].uci == "e2e4"
+    # Entries are shared between callers, so they must not be mutable
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].score_cp = 0
+    await query(chess.STARTING_FEN, n=1, depth=6)
+    assert calls == 2
+
+
 async def test_evaluate_invalid_fen(engine):
     with pytest.raises(ValueError):
         await engine.evaluate("not a valid fen")
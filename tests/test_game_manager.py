@@ -0,0 +1,154 @@
+"""Unit tests for GameManager LLM integration (mocked engine + teacher).
+
+These run GameManager directly and deliberately avoid importing server.main,
+so no FastAPI app, Stockfish process or ChromaDB client is set up.
+"""
+
+import pytest
+
+from server.engine import Evaluation, LineInfo, MoveInfo
+from server.game import GameManager
+from server.rag import Result
+from tests.fakes import FakeEngine
+
+
+# Engine results are built once; production code only reads them, so every
+# engine stub can hand out the same instances.
+
+# eval_before: White +100, best move is d2d4
+# eval_after: White -200 (big drop -- triggers coaching)
+# player move deep eval
+# We need multiple evaluate calls: eval_before, eval_after, then screen/validate calls
+_EVALUATIONS = (
+    # eval_before
+    Evaluation(score_cp=100, score_mate=None, depth=12, best_move="d2d4", pv=["d2d4"]),
+    # eval_after
+    Evaluation(score_cp=-200, score_mate=None, depth=12, best_move="d7d5", pv=["d7d5"]),
+    # screen_and_validate: validate pass deep evals (up to validate_breadth=4 candidates)
+    Evaluation(score_cp=100, score_mate=None, depth=14, best_move="e7e5", pv=["e7e5", "g1f3"]),
+    Evaluation(score_cp=90, score_mate=None, depth=14, best_move="d7d5", pv=["d7d5", "e4d5"]),
+    Evaluation(score_cp=80, score_mate=None, depth=14, best_move="g8f6", pv=["g8f6"]),
+    Evaluation(score_cp=70, score_mate=None, depth=14, best_move="f8c5", pv=["f8c5"]),
+    # player move annotation eval
+    Evaluation(score_cp=-200, score_mate=None, depth=14, best_move="d7d5", pv=["d7d5"]),
+)
+# analyze_lines for screen pass
+_SCREEN_LINES = (
+    LineInfo(uci="d2d4", san="d4", score_cp=100, score_mate=None, pv=["d2d4", "d7d5"], depth=10),
+    LineInfo(uci="g1f3", san="Nf3", score_cp=90, score_mate=None, pv=["g1f3", "b8c6"], depth=10),
+)
+# Opponent reply
+_OPPONENT_MOVES = (MoveInfo(uci="e7e5", score_cp=-10, score_mate=None),)
+
+
+def _engine() -> FakeEngine:
+    """An engine serving the canned results above, evaluations in order."""
+    return FakeEngine(_SCREEN_LINES, evaluations=_EVALUATIONS, moves=_OPPONENT_MOVES)
+
+
+_NO_TEACHER = object()
+
+_FORK_KNOWLEDGE = [
+    Result(id="1", text="A fork attacks two pieces.", metadata={"theme": "tactics"}, distance=0.1),
+]
+_UNWANTED_KNOWLEDGE = [
+    Result(id="1", text="This should not appear.", metadata={}, distance=0.1),
+]
+
+
+class _StubTeacher:
+    """Stands in for ChessTeacher: records prompts, returns a fixed reply."""
+
+    def __init__(self, reply: str | None):
+        self._reply = reply
+        self.prompts: list[str] = []
+
+    def build_debug_prompt(self, prompt: str, **kwargs) -> str:
+        return prompt
+
+    async def explain_move(self, prompt: str, **kwargs) -> str | None:
+        self.prompts.append(prompt)
+        return self._reply
+
+
+class _StubRag:
+    """Stands in for ChessRAG: returns fixed results or raises."""
+
+    def __init__(self, result: list[Result] | Exception):
+        self._result = result
+        self.queries: list[str] = []
+
+    async def query(self, text: str, n: int = 5) -> list[Result]:
+        self.queries.append(text)
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+class TestSessions:
+    def test_least_recently_used_session_evicted(self):
+        """Past max_sessions, the game untouched for longest is dropped."""
+        gm = GameManager(_engine(), max_sessions=2)
+        first, _, _ = gm.new_game()
+        second, _, _ = gm.new_game()
+        assert gm.get_game(first) is not None  # first is now most recent
+        third, _, _ = gm.new_game()
+        assert gm.get_game(second) is None
+        assert gm.get_game(first) is not None
+        assert gm.get_game(third) is not None
+
+
+class TestGameManagerLLM:
+    @pytest.mark.parametrize("reply", [
+        # Teacher's message replaces the hardcoded one
+        "Great effort, but d4 controls the center better!",
+        # Teacher returns None: hardcoded message is preserved
+        None,
+        # No teacher at all: hardcoded message is used
+        _NO_TEACHER,
+    ], ids=["llm", "fallback", "no_teacher"])
+    async def test_coaching_message(self, reply):
+        """The LLM reply is used when present, else the hardcoded message."""
+        teacher = None if reply is _NO_TEACHER else _StubTeacher(reply)
+        gm = GameManager(_engine(), teacher=teacher)
+        sid, _, _ = gm.new_game()
+
+        result = await gm.make_move(sid, "e2e4")
+        assert result["coaching"] is not None
+        if isinstance(reply, str):
+            assert result["coaching"]["message"] == reply
+        else:
+            # Hardcoded message pattern (mentions pawn loss)
+            assert "loses about" in result["coaching"]["message"]
+        if teacher is not None:
+            assert len(teacher.prompts) == 1
+
+    @pytest.mark.parametrize("rag_result,rag_top_k,context", [
+        # RAG knowledge reaches the LLM prompt
+        (_FORK_KNOWLEDGE, 3, "fork attacks two pieces"),
+        # No RAG: coaching works without a context section
+        (None, 3, None),
+        # RAG raises: coaching degrades gracefully to no context
+        (Exception("RAG is down"), 3, None),
+        # rag_top_k=0 disables retrieval entirely
+        (_UNWANTED_KNOWLEDGE, 0, None),
+    ], ids=["rag", "no_rag", "rag_failure", "rag_top_k_zero"])
+    async def test_coaching_rag_context(self, rag_result, rag_top_k, context):
+        """RAG results land in the prompt's context only when retrieved."""
+        teacher = _StubTeacher("Coaching with context!")
+        rag = None if rag_result is None else _StubRag(rag_result)
+        gm = GameManager(_engine(), teacher=teacher, rag=rag, rag_top_k=rag_top_k)
+        sid, _, _ = gm.new_game()
+
+        result = await gm.make_move(sid, "e2e4")
+        assert result["coaching"] is not None
+        assert result["coaching"]["message"] == "Coaching with context!"
+        assert len(teacher.prompts) == 1
+        prompt = teacher.prompts[0]
+        if context is None:
+            assert "# Context" not in prompt
+        else:
+            assert context in prompt
+        if rag_top_k == 0:
+            assert rag.queries == []
+            assert "This should not appear" not in prompt
@@ -1,7 +1,5 @@
 """Tests for game_tree module — GameNode, GameTree, build_coaching_tree."""
 
-from unittest.mock import AsyncMock
-
 import chess
 import pytest
 
@@ -21,6 +19,8 @@ from server.game_tree import (
     _rank_nodes_by_teachability,
     _get_continuation_chain,
 )
+from server.motifs import all_tactic_keys
+from tests.fakes import FakeEngine
 
 
 # --- Known positions ---
@@ -67,6 +67,15 @@ class TestGameNode:
         assert root.report is report
         assert root._report is report
 
+    def test_lazy_tactic_keys_computed_on_access(self):
+        """Tactic keys are cached as a frozenset of the node's tactics."""
+        root = _make_root(ITALIAN_FEN)
+        assert root._tactic_keys is None
+        keys = root.tactic_keys
+        assert isinstance(keys, frozenset)
+        assert keys == all_tactic_keys(root.tactics)
+        assert root.tactic_keys is keys
+
     def test_fullmove_number(self):
         """fullmove_number reflects the board state."""
         root = _make_root()
@@ -182,18 +191,18 @@ class TestGameTree:
 
 @pytest.fixture
 def mock_engine():
-    engine = AsyncMock()
-    engine.analyze_lines = AsyncMock(return_value=[
-        LineInfo(uci="e2e4", san="e4", score_cp=30, score_mate=None,
-                 pv=["e2e4", "e7e5"], depth=10),
-        LineInfo(uci="d2d4", san="d4", score_cp=25, score_mate=None,
-                 pv=["d2d4", "d7d5"], depth=10),
-    ])
-    engine.evaluate = AsyncMock(return_value=Evaluation(
-        score_cp=20, score_mate=None, depth=14, best_move="e7e5",
-        pv=["e7e5", "g1f3"],
-    ))
-    return engine
+    return FakeEngine(
+        [
+            LineInfo(uci="e2e4", san="e4", score_cp=30, score_mate=None,
+                     pv=["e2e4", "e7e5"], depth=10),
+            LineInfo(uci="d2d4", san="d4", score_cp=25, score_mate=None,
+                     pv=["d2d4", "d7d5"], depth=10),
+        ],
+        evaluation=Evaluation(
+            score_cp=20, score_mate=None, depth=14, best_move="e7e5",
+            pv=["e7e5", "g1f3"],
+        ),
+    )
 
 
 async def test_build_coaching_tree(mock_engine):
@@ -221,7 +230,7 @@ async def test_build_coaching_tree(mock_engine):
 
 async def test_build_coaching_tree_empty_lines(mock_engine):
     """build_coaching_tree handles empty engine lines gracefully."""
-    mock_engine.analyze_lines.return_value = []
+    mock_engine.lines = [[]]
     board = chess.Board()
     profile = get_profile("intermediate")
     eval_before = Evaluation(
@@ -268,15 +277,16 @@ async def test_build_coaching_tree_played_line_from_history():
     board.push(chess.Move.from_uci("e2e4"))
     board.push(chess.Move.from_uci("e7e5"))
 
-    engine = AsyncMock()
-    engine.analyze_lines = AsyncMock(return_value=[
-        LineInfo(uci="g1f3", san="Nf3", score_cp=30, score_mate=None,
-                 pv=["g1f3", "b8c6"], depth=10),
-    ])
-    engine.evaluate = AsyncMock(return_value=Evaluation(
-        score_cp=25, score_mate=None, depth=14, best_move="b8c6",
-        pv=["b8c6"],
-    ))
+    engine = FakeEngine(
+        [
+            LineInfo(uci="g1f3", san="Nf3", score_cp=30, score_mate=None,
+                     pv=["g1f3", "b8c6"], depth=10),
+        ],
+        evaluation=Evaluation(
+            score_cp=25, score_mate=None, depth=14, best_move="b8c6",
+            pv=["b8c6"],
+        ),
+    )
 
     profile = get_profile("intermediate")
     eval_before = Evaluation(
@@ -488,6 +498,14 @@ class TestDescribeOpponentMove:
         desc = _describe_opponent_move(board, move, student_is_white=True)
         assert "challenging the center" in desc
 
+    def test_board_left_unchanged(self):
+        """Describing a quiet move must not leave it pushed on the board."""
+        board = chess.Board("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1")
+        fen = board.fen()
+        _describe_opponent_move(board, chess.Move.from_uci("g8f6"), student_is_white=True)
+        assert board.fen() == fen
+        assert board.move_stack == []
+
 
 class TestMoveInsight:
     """Tests for _move_insight — one notable fact about a move."""
@@ -528,8 +546,7 @@ class TestMoveInsight:
 class TestGenerateOpponentResponses:
     @pytest.fixture
     def opponent_engine(self):
-        engine = AsyncMock()
-        engine.analyze_lines = AsyncMock(return_value=[
+        return FakeEngine([
             LineInfo(uci="b7c6", san="bxc6", score_cp=-50, score_mate=None,
                      pv=["b7c6", "f1c4"], depth=6),
             LineInfo(uci="d7c6", san="dxc6", score_cp=-80, score_mate=None,
@@ -537,7 +554,6 @@ class TestGenerateOpponentResponses:
             LineInfo(uci="g8f6", san="Nf6", score_cp=-120, score_mate=None,
                      pv=["g8f6", "c6a7"], depth=6),
         ])
-        return engine
 
     async def test_generates_responses(self, opponent_engine):
         """_generate_opponent_responses returns correct count and types."""
@@ -572,9 +588,8 @@ class TestGenerateOpponentResponses:
 
     async def test_filters_weak_responses(self):
         """Responses much worse than the best are filtered out by cp_threshold."""
-        engine = AsyncMock()
         # Best: Qxg5 at +300 (wins knight). Others: Be7 at -50 (450cp worse)
-        engine.analyze_lines = AsyncMock(return_value=[
+        engine = FakeEngine([
             LineInfo(uci="d8g5", san="Qxg5", score_cp=300, score_mate=None,
                      pv=["d8g5"], depth=6),
             LineInfo(uci="f8e7", san="Be7", score_cp=-50, score_mate=None,
@@ -597,8 +612,7 @@ class TestGenerateOpponentResponses:
 
     async def test_empty_engine_lines(self):
         """Empty engine response produces no opponent responses."""
-        engine = AsyncMock()
-        engine.analyze_lines = AsyncMock(return_value=[])
+        engine = FakeEngine([])
 
         board = chess.Board()
         player_node = GameNode(board=board, source="played")
@@ -627,12 +641,13 @@ async def test_build_coaching_tree_populates_opponent_responses():
                  pv=["d7d5", "e4d5"], depth=6),
     ]
 
-    engine = AsyncMock()
-    engine.analyze_lines = AsyncMock(side_effect=[screen_lines, opponent_lines])
-    engine.evaluate = AsyncMock(return_value=Evaluation(
-        score_cp=20, score_mate=None, depth=14, best_move="e7e5",
-        pv=["e7e5", "g1f3"],
-    ))
+    engine = FakeEngine(
+        screen_lines, opponent_lines,
+        evaluation=Evaluation(
+            score_cp=20, score_mate=None, depth=14, best_move="e7e5",
+            pv=["e7e5", "g1f3"],
+        ),
+    )
 
     board = chess.Board()
     profile = get_profile("intermediate")
@@ -3,6 +3,7 @@
 import httpx
 
 import chess
+import pytest
 
 from server.llm import (
     ChessTeacher,
@@ -50,6 +51,21 @@ def _sample_report(**overrides) -> str:
     return serialize_report(tree, **defaults)
 
 
+@pytest.fixture
+async def make_teacher():
+    """Build ChessTeachers against a fake URL; their clients close after the test."""
+    teachers = []
+
+    def _make(**kwargs) -> ChessTeacher:
+        teacher = ChessTeacher(base_url="http://fake", model="test", **kwargs)
+        teachers.append(teacher)
+        return teacher
+
+    yield _make
+    for teacher in teachers:
+        await teacher.aclose()
+
+
 class TestSerializeReport:
     def test_contains_player_move(self):
         report = _sample_report()
@@ -90,9 +106,9 @@ class TestSerializeReport:
 
 
 class TestExplainMove:
-    async def test_success(self, monkeypatch):
+    async def test_success(self, monkeypatch, make_teacher):
         """Mock a successful OpenAI-compatible response; verify string returned."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=2.0)
+        teacher = make_teacher(timeout=2.0)
 
         async def mock_post(self, url, **kwargs):
             resp = httpx.Response(
@@ -106,9 +122,9 @@ class TestExplainMove:
         result = await teacher.explain_move("You played e4. Stronger move: d4.")
         assert result == "Nice try, but d4 controls the center better."
 
-    async def test_timeout_returns_none(self, monkeypatch):
+    async def test_timeout_returns_none(self, monkeypatch, make_teacher):
         """On timeout, explain_move returns None."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=0.01)
+        teacher = make_teacher(timeout=0.01)
 
         async def mock_post(self, url, **kwargs):
             raise httpx.ReadTimeout("timed out")
@@ -117,9 +133,9 @@ class TestExplainMove:
         result = await teacher.explain_move("test prompt")
         assert result is None
 
-    async def test_connection_error_returns_none(self, monkeypatch):
+    async def test_connection_error_returns_none(self, monkeypatch, make_teacher):
         """On connection failure, explain_move returns None."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=2.0)
+        teacher = make_teacher(timeout=2.0)
 
         async def mock_post(self, url, **kwargs):
             raise httpx.ConnectError("connection refused")
@@ -128,9 +144,9 @@ class TestExplainMove:
         result = await teacher.explain_move("test prompt")
         assert result is None
 
-    async def test_bad_json_returns_none(self, monkeypatch):
+    async def test_bad_json_returns_none(self, monkeypatch, make_teacher):
         """On malformed JSON response, explain_move returns None."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=2.0)
+        teacher = make_teacher(timeout=2.0)
 
         async def mock_post(self, url, **kwargs):
             return httpx.Response(
@@ -143,9 +159,9 @@ class TestExplainMove:
         result = await teacher.explain_move("test prompt")
         assert result is None
 
-    async def test_api_key_sent_in_header(self, monkeypatch):
+    async def test_api_key_sent_in_header(self, monkeypatch, make_teacher):
         """When api_key is set, Authorization header is sent."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", api_key="sk-test", timeout=2.0)
+        teacher = make_teacher(api_key="sk-test", timeout=2.0)
         captured_headers = {}
 
         async def mock_post(self, url, **kwargs):
@@ -160,9 +176,9 @@ class TestExplainMove:
         await teacher.explain_move("test")
         assert captured_headers.get("Authorization") == "Bearer sk-test"
 
-    async def test_no_api_key_no_header(self, monkeypatch):
+    async def test_no_api_key_no_header(self, monkeypatch, make_teacher):
         """When api_key is None, no Authorization header is sent."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=2.0)
+        teacher = make_teacher(timeout=2.0)
         captured_headers = {}
 
         async def mock_post(self, url, **kwargs):
@@ -177,6 +193,26 @@ class TestExplainMove:
         await teacher.explain_move("test")
         assert "Authorization" not in captured_headers
 
+    async def test_client_reused_across_calls(self, monkeypatch, make_teacher):
+        """Requests share one pooled client until aclose()."""
+        teacher = make_teacher(timeout=2.0)
+        clients = []
+
+        async def mock_post(self, url, **kwargs):
+            clients.append(self)
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": "advice"}}]},
+                request=httpx.Request("POST", url),
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        await teacher.explain_move("one")
+        await teacher.explain_move("two")
+        assert clients[0] is clients[1]
+        await teacher.aclose()
+        assert clients[0].is_closed
+
 
 class TestParseMoveSeletion:
     def test_valid_json(self):
@@ -206,9 +242,9 @@ class TestParseMoveSeletion:
 
 
 class TestSelectTeachingMove:
-    async def test_success(self, monkeypatch):
+    async def test_success(self, monkeypatch, make_teacher):
         """Mock a successful OpenAI-compatible response with valid JSON."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=2.0)
+        teacher = make_teacher(timeout=2.0)
 
         async def mock_post(self, url, **kwargs):
             return httpx.Response(
@@ -231,9 +267,9 @@ class TestSelectTeachingMove:
         result = await teacher.select_teaching_move(ctx)
         assert result == ("Nf3", "develops knight")
 
-    async def test_timeout_returns_none(self, monkeypatch):
+    async def test_timeout_returns_none(self, monkeypatch, make_teacher):
         """On timeout, select_teaching_move returns None."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=0.01)
+        teacher = make_teacher(timeout=0.01)
 
         async def mock_post(self, url, **kwargs):
             raise httpx.ReadTimeout("timed out")
@@ -246,9 +282,9 @@ class TestSelectTeachingMove:
         result = await teacher.select_teaching_move(ctx)
         assert result is None
 
-    async def test_bad_json_returns_none(self, monkeypatch):
+    async def test_bad_json_returns_none(self, monkeypatch, make_teacher):
         """On garbage LLM output, select_teaching_move returns None."""
-        teacher = ChessTeacher(base_url="http://fake", model="test", timeout=2.0)
+        teacher = make_teacher(timeout=2.0)
 
         async def mock_post(self, url, **kwargs):
             return httpx.Response(